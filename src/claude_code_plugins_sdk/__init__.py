@@ -42,6 +42,7 @@ from .models import (
     GitHubSource,
     HookEntry,
     HookEvent,
+    HookEventName,
     HookMatcher,
     HooksConfig,
     HTTPSource,
@@ -98,6 +99,7 @@ __all__ = [
     "HTTPSource",
     "HookEntry",
     "HookEvent",
+    "HookEventName",
     "HookMatcher",
     "HooksConfig",
     "LSPServerConfig",
@@ -0,0 +1,59 @@
+"""JSON codec shared by loaders and adapters.
+
+Routes through orjson when the optional ``json`` extra is installed; its
+C parser and serializer are several times faster than the stdlib on
+manifest-shaped data. Falls back to the stdlib transparently — orjson's
+``JSONDecodeError`` subclasses the stdlib one, so callers catch errors the
+same way on either backend.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic import ValidationError
+
+from .errors import LoadError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_T = TypeVar("_T")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_indented(obj: Any) -> str:
+    """Serialize obj as 2-space-indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
+def validate_json(validate: Callable[[bytes], _T], data: bytes, path: Path) -> _T:
+    """Run a pydantic JSON validator (``Model.model_validate_json`` or
+    ``TypeAdapter.validate_json``) directly over raw bytes.
+
+    Parsing inside pydantic's Rust core skips materializing an intermediate
+    Python dict. JSON syntax errors are mapped back to LoadError so callers
+    see the same exception split as before: LoadError for malformed JSON,
+    ValidationError for well-formed JSON with a bad schema.
+    """
+    try:
+        return validate(data)
+    except ValidationError as e:
+        if any(err.get("type") == "json_invalid" for err in e.errors()):
+            raise LoadError(f"Invalid JSON in {path}: {e}", path=path) from e
+        raise
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import heapq
+import mmap
+import os
 import re
+import sys
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 if TYPE_CHECKING:
     from ..manager._manager import PluginManager
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SkillSummary:
     """Lightweight skill metadata — no body loaded."""
 
@@ -26,7 +33,7 @@ class SkillSummary:
         return f"{self.plugin}:{self.slug}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SkillMatch:
     """A skill with a relevance score from a search."""
 
@@ -34,7 +41,7 @@ class SkillMatch:
     score: float  # 0.0–1.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandSummary:
     """Lightweight command metadata — no body loaded."""
 
@@ -50,7 +57,7 @@ class CommandSummary:
         return f"{self.plugin}:{self.slug}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandMatch:
     """A command with a relevance score from a search."""
 
@@ -58,7 +65,7 @@ class CommandMatch:
     score: float  # 0.0–1.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentSummary:
     """Lightweight agent metadata — no body loaded."""
 
@@ -73,7 +80,7 @@ class AgentSummary:
         return f"{self.plugin}:{self.slug}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentMatch:
     """An agent with a relevance score from a search."""
 
@@ -81,6 +88,62 @@ class AgentMatch:
     score: float  # 0.0–1.0
 
 
+_SummaryT = TypeVar("_SummaryT", SkillSummary, CommandSummary, AgentSummary)
+
+
+@dataclass
+class _KindIndex(Generic[_SummaryT]):
+    """Structure-of-arrays storage for one kind of indexed summary.
+
+    Entry i owns slot i of every parallel list, so the scoring loop touches
+    only the token postings and never dereferences a summary object until a
+    match is materialized.
+    """
+
+    summaries: list[_SummaryT] = field(default_factory=list)
+    paths: list[Path] = field(default_factory=list)
+    name_tokens: list[frozenset[str]] = field(default_factory=list)
+    desc_tokens: list[frozenset[str]] = field(default_factory=list)
+    # "plugin:slug" per entry, precomputed so sorting never invokes the
+    # summary's id property (which rebuilds the f-string on every call).
+    ids: list[str] = field(default_factory=list)
+    # token -> [(entry_idx, weight)]
+    postings: dict[str, list[tuple[int, float]]] = field(default_factory=dict)
+    # (plugin, slug) -> path for O(1) get_* lookups
+    path_by_key: dict[tuple[str, str], Path] = field(default_factory=dict)
+    # Sorted view of the posting tokens, built lazily for prefix expansion.
+    _sorted_tokens: list[str] | None = field(default=None, repr=False)
+
+    def prefix_tokens(self, prefix: str) -> list[str]:
+        """Indexed tokens that start with prefix, excluding an exact match.
+
+        Binary search over a sorted token list gives the same O(|prefix| +
+        log N) range lookup a trie would, without a third index structure.
+        """
+        tokens = self._sorted_tokens
+        if tokens is None:
+            tokens = self._sorted_tokens = sorted(self.postings)
+        matches: list[str] = []
+        for i in range(bisect_left(tokens, prefix), len(tokens)):
+            tok = tokens[i]
+            if not tok.startswith(prefix):
+                break
+            if tok != prefix:
+                matches.append(tok)
+        return matches
+
+    def add(self, summary: _SummaryT, path: Path) -> None:
+        name_tokens, desc_tokens = _field_token_sets(summary)
+        _add_postings(self.postings, len(self.summaries), name_tokens, desc_tokens)
+        self.summaries.append(summary)
+        self.paths.append(path)
+        self.name_tokens.append(name_tokens)
+        self.desc_tokens.append(desc_tokens)
+        self.ids.append(f"{summary.plugin}:{summary.slug}")
+        self.path_by_key[(summary.plugin, summary.slug)] = path
+        self._sorted_tokens = None
+
+
 @dataclass
 class AgentRuntime:
     """Read-only view of skills from installed, enabled plugins.
@@ -93,9 +156,14 @@ class AgentRuntime:
         full = runtime.get_skill("my-plugin", "code-review")
     """
 
-    _index: list[tuple[SkillSummary, Path]] = field(default_factory=list, repr=False)
-    _cmd_index: list[tuple[CommandSummary, Path]] = field(default_factory=list, repr=False)
-    _agent_index: list[tuple[AgentSummary, Path]] = field(default_factory=list, repr=False)
+    _skills: _KindIndex[SkillSummary] = field(default_factory=_KindIndex, repr=False)
+    _commands: _KindIndex[CommandSummary] = field(default_factory=_KindIndex, repr=False)
+    _agents: _KindIndex[AgentSummary] = field(default_factory=_KindIndex, repr=False)
+    # Lazily built full-match lists for the empty-query fast path; the index
+    # is immutable after construction, so these never need invalidation.
+    _all_skill_matches: list[SkillMatch] | None = field(default=None, repr=False)
+    _all_cmd_matches: list[CommandMatch] | None = field(default=None, repr=False)
+    _all_agent_matches: list[AgentMatch] | None = field(default=None, repr=False)
 
     # --- factory ---
 
@@ -104,6 +172,7 @@ class AgentRuntime:
         """Build a runtime by loading skills from all installed, enabled plugins."""
         runtime = cls()
         seen_plugins: set[str] = set()
+        plugins: list[tuple[str, Path]] = []
 
         for installed in manager.list_installed():
             if not installed.enabled:
@@ -113,30 +182,10 @@ class AgentRuntime:
             seen_plugins.add(installed.name)
 
             plugin_dir = _resolve_plugin_dir(manager, installed.name, installed.marketplace)
-            if plugin_dir is None:
-                continue
-
-            skills_dir = plugin_dir / "skills"
-            if skills_dir.is_dir():
-                for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
-                    slug = skill_md.parent.name
-                    try:
-                        skill_def = _load_skill_meta(skill_md)
-                    except Exception:
-                        continue
-                    summary = SkillSummary(
-                        plugin=installed.name,
-                        slug=slug,
-                        name=skill_def.get("name"),
-                        description=skill_def.get("description"),
-                        disable_model_invocation=bool(
-                            skill_def.get("disable-model-invocation", False)
-                        ),
-                    )
-                    runtime._index.append((summary, skill_md))
-
-            _index_commands_and_agents(runtime, installed.name, plugin_dir)
+            if plugin_dir is not None:
+                plugins.append((installed.name, plugin_dir))
 
+        _build_index(runtime, plugins)
         return runtime
 
     @classmethod
@@ -146,35 +195,14 @@ class AgentRuntime:
         Useful for testing or when you manage plugin paths yourself.
         """
         runtime = cls()
-        for plugin_name, plugin_dir in plugins:
-            skills_dir = plugin_dir / "skills"
-            if skills_dir.is_dir():
-                for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
-                    slug = skill_md.parent.name
-                    try:
-                        skill_def = _load_skill_meta(skill_md)
-                    except Exception:
-                        continue
-                    summary = SkillSummary(
-                        plugin=plugin_name,
-                        slug=slug,
-                        name=skill_def.get("name"),
-                        description=skill_def.get("description"),
-                        disable_model_invocation=bool(
-                            skill_def.get("disable-model-invocation", False)
-                        ),
-                    )
-                    runtime._index.append((summary, skill_md))
-
-            _index_commands_and_agents(runtime, plugin_name, plugin_dir)
-
+        _build_index(runtime, plugins)
         return runtime
 
     # --- public API ---
 
     def list_skills(self) -> list[SkillSummary]:
         """Return metadata for all available skills. No body loaded."""
-        return [summary for summary, _ in self._index]
+        return list(self._skills.summaries)
 
     def get_skill(self, plugin: str, slug: str) -> str:
         """Return the full SKILL.md body for a skill.
@@ -189,10 +217,10 @@ class AgentRuntime:
         Raises:
             KeyError: If no matching skill is found.
         """
-        for summary, path in self._index:
-            if summary.plugin == plugin and summary.slug == slug:
-                return path.read_text(encoding="utf-8")
-        raise KeyError(f"Skill not found: {plugin}:{slug}")
+        path = self._skills.path_by_key.get((plugin, slug))
+        if path is None:
+            raise KeyError(f"Skill not found: {plugin}:{slug}")
+        return _read_body(path)
 
     def search_skills(self, query: str, limit: int = 10) -> list[SkillMatch]:
         """Search skills by name and description using in-memory token matching.
@@ -209,20 +237,22 @@ class AgentRuntime:
         """
         tokens = _tokenize(query)
         if not tokens:
-            return [SkillMatch(skill=s, score=1.0) for s, _ in self._index[:limit]]
-
-        results: list[SkillMatch] = []
-        for summary, _ in self._index:
-            score = _score(summary, tokens)
-            if score > 0:
-                results.append(SkillMatch(skill=summary, score=score))
-
-        results.sort(key=lambda m: (-m.score, m.skill.id))
-        return results[:limit]
+            if self._all_skill_matches is None:
+                self._all_skill_matches = [
+                    SkillMatch(skill=s, score=1.0) for s in self._skills.summaries
+                ]
+            return self._all_skill_matches[:limit]
+
+        scored = _score_postings(self._skills, tokens)
+        summaries = self._skills.summaries
+        return [
+            SkillMatch(skill=summaries[i], score=score)
+            for i, score in _top_scored(scored, self._skills.ids, limit)
+        ]
 
     def list_commands(self) -> list[CommandSummary]:
         """Return metadata for all available commands. No body loaded."""
-        return [s for s, _ in self._cmd_index]
+        return list(self._commands.summaries)
 
     def get_command(self, plugin: str, slug: str) -> str:
         """Return the full body for a command.
@@ -237,10 +267,10 @@ class AgentRuntime:
         Raises:
             KeyError: If no matching command is found.
         """
-        for s, path in self._cmd_index:
-            if s.plugin == plugin and s.slug == slug:
-                return path.read_text(encoding="utf-8")
-        raise KeyError(f"Command not found: {plugin}:{slug}")
+        path = self._commands.path_by_key.get((plugin, slug))
+        if path is None:
+            raise KeyError(f"Command not found: {plugin}:{slug}")
+        return _read_body(path)
 
     def search_commands(self, query: str, limit: int = 10) -> list[CommandMatch]:
         """Search commands by name and description using in-memory token matching.
@@ -254,18 +284,21 @@ class AgentRuntime:
         """
         tokens = _tokenize(query)
         if not tokens:
-            return [CommandMatch(command=s, score=1.0) for s, _ in self._cmd_index[:limit]]
-        results = []
-        for s, _ in self._cmd_index:
-            sc = _score_fields(s.name, s.description, s.slug, s.plugin, tokens)
-            if sc > 0:
-                results.append(CommandMatch(command=s, score=sc))
-        results.sort(key=lambda m: (-m.score, m.command.id))
-        return results[:limit]
+            if self._all_cmd_matches is None:
+                self._all_cmd_matches = [
+                    CommandMatch(command=s, score=1.0) for s in self._commands.summaries
+                ]
+            return self._all_cmd_matches[:limit]
+        scored = _score_postings(self._commands, tokens)
+        summaries = self._commands.summaries
+        return [
+            CommandMatch(command=summaries[i], score=score)
+            for i, score in _top_scored(scored, self._commands.ids, limit)
+        ]
 
     def list_agents(self) -> list[AgentSummary]:
         """Return metadata for all available agents. No body loaded."""
-        return [s for s, _ in self._agent_index]
+        return list(self._agents.summaries)
 
     def get_agent(self, plugin: str, slug: str) -> str:
         """Return the full body for an agent.
@@ -280,10 +313,10 @@ class AgentRuntime:
         Raises:
             KeyError: If no matching agent is found.
         """
-        for s, path in self._agent_index:
-            if s.plugin == plugin and s.slug == slug:
-                return path.read_text(encoding="utf-8")
-        raise KeyError(f"Agent not found: {plugin}:{slug}")
+        path = self._agents.path_by_key.get((plugin, slug))
+        if path is None:
+            raise KeyError(f"Agent not found: {plugin}:{slug}")
+        return _read_body(path)
 
     def search_agents(self, query: str, limit: int = 10) -> list[AgentMatch]:
         """Search agents by name and description using in-memory token matching.
@@ -297,65 +330,186 @@ class AgentRuntime:
         """
         tokens = _tokenize(query)
         if not tokens:
-            return [AgentMatch(agent=s, score=1.0) for s, _ in self._agent_index[:limit]]
-        results = []
-        for s, _ in self._agent_index:
-            sc = _score_fields(s.name, s.description, s.slug, s.plugin, tokens)
-            if sc > 0:
-                results.append(AgentMatch(agent=s, score=sc))
-        results.sort(key=lambda m: (-m.score, m.agent.id))
-        return results[:limit]
+            if self._all_agent_matches is None:
+                self._all_agent_matches = [
+                    AgentMatch(agent=s, score=1.0) for s in self._agents.summaries
+                ]
+            return self._all_agent_matches[:limit]
+        scored = _score_postings(self._agents, tokens)
+        summaries = self._agents.summaries
+        return [
+            AgentMatch(agent=summaries[i], score=score)
+            for i, score in _top_scored(scored, self._agents.ids, limit)
+        ]
 
 
 # --- internal helpers ---
 
 
-def _index_commands_and_agents(runtime: AgentRuntime, plugin_name: str, plugin_dir: Path) -> None:
-    """Index commands and agents from a plugin directory into the runtime."""
-    commands_dir = plugin_dir / "commands"
-    if commands_dir.is_dir():
-        for cmd_md in sorted(commands_dir.glob("*.md")):
-            slug = cmd_md.stem
-            try:
-                meta = _load_skill_meta(cmd_md)
-            except Exception:
-                continue
+def _build_index(runtime: AgentRuntime, plugins: list[tuple[str, Path]]) -> None:
+    """Discover and index skills, commands, and agents for all plugins.
+
+    File discovery happens in deterministic (sorted) order; frontmatter
+    parsing — the I/O-heavy part — is fanned out across a thread pool, and
+    summaries are then built in a single-threaded pass so index order stays
+    stable.
+    """
+    files: list[tuple[str, str, str, Path]] = []  # (plugin, kind, slug, path)
+    append = files.append
+    for plugin_name, plugin_dir in plugins:
+        skill_files, cmd_files, agent_files = _walk_plugin(plugin_dir)
+        for slug, skill_md in skill_files:
+            append((plugin_name, "skill", slug, skill_md))
+        for slug, cmd_md in cmd_files:
+            append((plugin_name, "command", slug, cmd_md))
+        for slug, agent_md in agent_files:
+            append((plugin_name, "agent", slug, agent_md))
+
+    if not files:
+        return
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(files))
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            metas = list(executor.map(_load_skill_meta_safe, (path for *_, path in files)))
+    else:
+        metas = [_load_skill_meta_safe(path) for *_, path in files]
+
+    # Each arm adds to its own concretely-typed index: converging on one
+    # union-typed (summary, index) pair would lose the per-kind pairing the
+    # generic _KindIndex encodes.
+    for (plugin_name, kind, slug, path), meta in zip(files, metas, strict=True):
+        if meta is None:
+            continue
+        if kind == "skill":
+            runtime._skills.add(
+                SkillSummary(
+                    plugin=plugin_name,
+                    slug=slug,
+                    name=meta.get("name"),
+                    description=meta.get("description"),
+                    disable_model_invocation=bool(meta.get("disable-model-invocation", False)),
+                ),
+                path,
+            )
+        elif kind == "command":
             tools = meta.get("allowed-tools") or []
             if isinstance(tools, str):
                 tools = [t.strip() for t in tools.split(",") if t.strip()]
-            summary = CommandSummary(
-                plugin=plugin_name,
-                slug=slug,
-                name=meta.get("name"),
-                description=meta.get("description"),
-                argument_hint=meta.get("argument-hint"),
-                allowed_tools=tools,
+            runtime._commands.add(
+                CommandSummary(
+                    plugin=plugin_name,
+                    slug=slug,
+                    name=meta.get("name"),
+                    description=meta.get("description"),
+                    argument_hint=meta.get("argument-hint"),
+                    allowed_tools=tools,
+                ),
+                path,
             )
-            runtime._cmd_index.append((summary, cmd_md))
-
-    agents_dir = plugin_dir / "agents"
-    if agents_dir.is_dir():
-        for agent_md in sorted(agents_dir.glob("*.md")):
-            slug = agent_md.stem
-            try:
-                meta = _load_skill_meta(agent_md)
-            except Exception:
-                continue
+        else:
             tools_raw = meta.get("tools") or []
             if isinstance(tools_raw, str):
                 tools_raw = [t.strip() for t in tools_raw.split(",") if t.strip()]
-            summary = AgentSummary(
-                plugin=plugin_name,
-                slug=slug,
-                name=meta.get("name"),
-                description=meta.get("description"),
-                tools=tools_raw,
+            runtime._agents.add(
+                AgentSummary(
+                    plugin=plugin_name,
+                    slug=slug,
+                    name=meta.get("name"),
+                    description=meta.get("description"),
+                    tools=tools_raw,
+                ),
+                path,
             )
-            runtime._agent_index.append((summary, agent_md))
+
+
+def _walk_plugin(
+    plugin_dir: Path,
+) -> tuple[list[tuple[str, Path]], list[tuple[str, Path]], list[tuple[str, Path]]]:
+    """Find a plugin's skill, command, and agent files in one root pass.
+
+    A single scandir of the plugin root identifies which component
+    directories exist, so absent ones cost nothing and present ones are
+    scanned exactly once.
+    """
+    skills_path = commands_path = agents_path = None
+    try:
+        with os.scandir(plugin_dir) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name == "skills":
+                    skills_path = entry.path
+                elif entry.name == "commands":
+                    commands_path = entry.path
+                elif entry.name == "agents":
+                    agents_path = entry.path
+    except OSError:
+        return [], [], []
+    return (
+        _scan_skill_files(Path(skills_path)) if skills_path else [],
+        _scan_md_files(Path(commands_path)) if commands_path else [],
+        _scan_md_files(Path(agents_path)) if agents_path else [],
+    )
+
+
+def _scan_skill_files(skills_dir: Path) -> list[tuple[str, Path]]:
+    """Return sorted (slug, SKILL.md path) pairs from a skills directory.
+
+    Uses os.scandir so subdirectory checks hit the cached dirent type instead
+    of a stat per entry; a missing or unreadable directory yields [].
+    """
+    found: list[tuple[str, Path]] = []
+    try:
+        with os.scandir(skills_dir) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    skill_md = Path(entry.path) / "SKILL.md"
+                    if skill_md.is_file():
+                        found.append((entry.name, skill_md))
+    except OSError:
+        return []
+    found.sort()
+    return found
+
+
+def _scan_md_files(directory: Path) -> list[tuple[str, Path]]:
+    """Return sorted (slug, path) pairs for *.md files in a directory.
+
+    Uses os.scandir for the same reason as _scan_skill_files; a missing or
+    unreadable directory yields [].
+    """
+    found: list[tuple[str, Path]] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False):
+                    found.append((entry.name[:-3], Path(entry.path)))
+    except OSError:
+        return []
+    found.sort()
+    return found
 
 
 def _resolve_plugin_dir(manager: PluginManager, plugin_name: str, marketplace: str) -> Path | None:
-    """Find the plugin directory within a marketplace cache."""
+    """Find the plugin directory within a marketplace cache.
+
+    Results are memoized on the manager (invalidated there on install,
+    uninstall, and marketplace changes) so repeated runtime builds don't
+    re-stat the same candidate directories.
+    """
+    cache = manager._plugin_dir_cache
+    key = (plugin_name, marketplace)
+    if key in cache:
+        return cache[key]
+    resolved = _resolve_plugin_dir_uncached(manager, plugin_name, marketplace)
+    cache[key] = resolved
+    return resolved
+
+
+def _resolve_plugin_dir_uncached(
+    manager: PluginManager, plugin_name: str, marketplace: str
+) -> Path | None:
     # Check plugin-specific cache first (for externally-sourced plugins)
     try:
         plugin_cache = manager._state.get_plugin_cache_path(marketplace, plugin_name)
@@ -382,50 +536,177 @@ def _resolve_plugin_dir(manager: PluginManager, plugin_name: str, marketplace: s
     return None
 
 
+# Resolved on first use so importing this module stays cheap; caching the
+# module and loader avoids re-running the import machinery per parsed file.
+_yaml = None
+_yaml_loader = None
+
+
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+def _read_body(path: Path) -> str:
+    """Read a markdown body as UTF-8, with an mtime-validated cache.
+
+    Repeated reads of an unchanged file — e.g. an agent loop fetching the
+    same skill body — cost one stat syscall instead of a disk read and
+    decode. A modified file changes its mtime_ns and misses the cache.
+    """
+    return _read_body_cached(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _read_body_cached(path_str: str, mtime_ns: int) -> str:
+    """Read a body; bodies at least _MMAP_MIN_SIZE decode straight out of a
+    memory map, skipping the intermediate read buffer, while smaller files
+    aren't worth the mmap setup cost and use a plain binary read."""
+    with open(path_str, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped[:].decode("utf-8")
+        return f.read().decode("utf-8")
+
+
 def _load_skill_meta(path: Path) -> dict:
-    """Parse YAML frontmatter from a SKILL.md without loading the body model."""
-    import frontmatter
+    """Parse YAML frontmatter from a SKILL.md without reading the body.
 
-    post = frontmatter.load(str(path))
-    return dict(post.metadata)
+    Only the lines between the opening and closing `---` fences are read and
+    fed to the YAML parser; the (potentially large) markdown body is never
+    loaded into memory.
+    """
+    global _yaml, _yaml_loader
+    if _yaml is None:
+        import yaml
+
+        _yaml = yaml
+        _yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    with open(path, encoding="utf-8") as f:
+        if f.readline().strip() != "---":
+            return {}
+        lines: list[str] = []
+        for line in f:
+            if line.strip() == "---":
+                break
+            lines.append(line)
+        else:
+            # No closing fence — not valid frontmatter.
+            return {}
+
+    meta = _yaml.load("".join(lines), Loader=_yaml_loader)
+    return meta if isinstance(meta, dict) else {}
+
+
+def _load_skill_meta_safe(path: Path) -> dict | None:
+    """_load_skill_meta variant for executor maps — parse errors become None."""
+    try:
+        return _load_skill_meta(path)
+    except Exception:
+        return None
 
 
-_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+_find_tokens = _TOKEN_RE.findall
 
 
 def _tokenize(text: str) -> list[str]:
-    return _TOKEN_RE.findall(text.lower())
+    # Match mixed-case runs and fold each token individually — lowercasing a
+    # long haystack up front would allocate a full copy just to tokenize it.
+    return [t.lower() for t in _find_tokens(text)]
 
 
-def _score_fields(
-    name: str | None,
-    description: str | None,
-    slug: str,
-    plugin: str,
-    query_tokens: list[str],
-) -> float:
-    """Score fields against query tokens. Returns 0.0–1.0."""
-    haystack = " ".join(filter(None, [name, description, slug, plugin]))
-    hay_tokens = set(_tokenize(haystack))
-    if not hay_tokens:
-        return 0.0
-
-    # Name/slug matches are weighted higher than description matches
-    name_tokens = set(_tokenize(" ".join(filter(None, [name, slug]))))
-    desc_tokens = set(_tokenize(description or ""))
-
-    hits = 0.0
-    for t in query_tokens:
-        if t in name_tokens:
-            hits += 2.0
-        elif t in desc_tokens:
-            hits += 1.0
-
-    return min(hits / (len(query_tokens) * 2.0), 1.0)
-
-
-def _score(summary: SkillSummary, query_tokens: list[str]) -> float:
-    """Thin wrapper kept for backward compatibility."""
-    return _score_fields(
-        summary.name, summary.description, summary.slug, summary.plugin, query_tokens
+def _field_token_sets(
+    summary: SkillSummary | CommandSummary | AgentSummary,
+) -> tuple[frozenset[str], frozenset[str]]:
+    """Tokenize a summary's fields once, for reuse by every search path.
+
+    Returns (name_tokens, desc_tokens); description tokens that also appear
+    in the name/slug are folded into name_tokens only. Tokens are interned:
+    common words ("code", "review", ...) recur across many summaries, and
+    interning collapses them to one str object per distinct token, which
+    also lets set membership hit the pointer-equality fast path.
+    """
+    intern = sys.intern
+    name_tokens = frozenset(
+        intern(t) for t in _tokenize(" ".join(filter(None, [summary.name, summary.slug])))
     )
+    desc_tokens = frozenset(intern(t) for t in _tokenize(summary.description or "")) - name_tokens
+    return name_tokens, desc_tokens
+
+
+def _add_postings(
+    postings: dict[str, list[tuple[int, float]]],
+    idx: int,
+    name_tokens: frozenset[str],
+    desc_tokens: frozenset[str],
+) -> None:
+    """Add a summary's precomputed tokens to an inverted index.
+
+    Name/slug matches are weighted higher than description matches.
+    """
+    setdefault = postings.setdefault
+    for tok in name_tokens:
+        setdefault(tok, []).append((idx, 2.0))
+    for tok in desc_tokens:
+        setdefault(tok, []).append((idx, 1.0))
+
+
+def _top_scored(
+    scored: list[tuple[int, float]],
+    ids: list[str],
+    limit: int,
+) -> list[tuple[int, float]]:
+    """Select the top-limit (idx, score) pairs ordered by score desc, id asc.
+
+    When limit is smaller than the result set — the common case — a heap
+    selection is O(N log limit) instead of the O(N log N) full sort.
+    """
+
+    def key(item: tuple[int, float]) -> tuple[float, str]:
+        return (-item[1], ids[item[0]])
+
+    if limit < len(scored):
+        return heapq.nsmallest(limit, scored, key=key)
+    scored.sort(key=key)
+    return scored
+
+
+def _score_postings(
+    index: _KindIndex,
+    query_tokens: list[str],
+) -> list[tuple[int, float]]:
+    """Score summaries against query tokens via the inverted index.
+
+    Each query token scores its exact postings at full weight, then expands
+    to indexed tokens it prefixes at half weight — so a partially typed
+    "cod" still surfaces "code-review" below exact matches. Per query token
+    only the strongest expansion counts for a summary: summing them would
+    let an entry whose tokens merely share a prefix accumulate past an
+    exact match. Only summaries sharing at least one (prefixed) token with
+    the query are visited. Returns (summary_idx, score) pairs with scores
+    in 0.0–1.0.
+    """
+    # The accumulation loop is the hot kernel for large indexes; pre-binding
+    # the dict methods keeps each iteration to plain C-level calls.
+    hits: dict[int, float] = {}
+    postings = index.postings
+    postings_get = postings.get
+    hits_get = hits.get
+    for tok in query_tokens:
+        for idx, weight in postings_get(tok, ()):
+            hits[idx] = hits_get(idx, 0.0) + weight
+        expanded = index.prefix_tokens(tok)
+        if not expanded:
+            continue
+        best: dict[int, float] = {}
+        best_get = best.get
+        for full_tok in expanded:
+            for idx, weight in postings[full_tok]:
+                half = weight * 0.5
+                if half > best_get(idx, 0.0):
+                    best[idx] = half
+        for idx, contribution in best.items():
+            hits[idx] = hits_get(idx, 0.0) + contribution
+
+    max_hits = len(query_tokens) * 2.0
+    return [(idx, min(total / max_hits, 1.0)) for idx, total in hits.items()]
@@ -50,6 +50,8 @@ def fetch_marketplace(
 def _detect(s: str) -> GitHubSource | URLSource | HTTPSource:
     if s.endswith(".git"):
         return URLSource(source="url", url=s)
-    if _GITHUB_SHORTHAND.match(s):
+    # Cheap substring checks rule out full URLs before the regex runs; the
+    # regex stays as final validation of the "owner/repo" shorthand.
+    if "://" not in s and s.count("/") == 1 and _GITHUB_SHORTHAND.match(s):
         return GitHubSource(source="github", repo=s)
     return HTTPSource(source="http", url=s)
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+import io
+import os
 import subprocess
+import tarfile
 import tempfile
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -13,11 +18,13 @@ if TYPE_CHECKING:
 
 
 def fetch_via_git(url: str, ref: str | None = None, sha: str | None = None) -> MarketplaceManifest:
-    """Clone a git repo and load its marketplace manifest."""
+    """Fetch a git repo's tree and load its marketplace manifest."""
     with tempfile.TemporaryDirectory() as tmpdir:
-        _clone(url, Path(tmpdir), ref=ref)
+        # Only the manifest is read from the tree, so extraction can be
+        # narrowed to .claude-plugin/ instead of the whole repository.
+        head = materialize_repo(url, Path(tmpdir), ref=ref, paths=(".claude-plugin",))
         if sha:
-            _verify_sha(Path(tmpdir), sha, url)
+            _verify_sha(head, sha, url)
         return load_marketplace(Path(tmpdir))
 
 
@@ -25,30 +32,265 @@ def github_url(repo: str) -> str:
     return f"https://github.com/{repo}.git"
 
 
+def materialize_repo(
+    url: str,
+    dest: Path,
+    ref: str | None = None,
+    paths: tuple[str, ...] | None = None,
+) -> str | None:
+    """Materialize a repo's tree at dest, reusing the persistent git cache.
+
+    A first fetch of a URL pays the full object transfer; later fetches
+    negotiate against the cached objects, so refreshing an unchanged repo is
+    close to a no-op on the wire. Falls back to a direct shallow clone when
+    the cache directory is unusable.
+
+    Args:
+        url: Repository URL.
+        dest: Directory to extract the tree into.
+        ref: Branch or tag to fetch; defaults to the remote HEAD.
+        paths: Optional pathspecs restricting which parts of the tree are
+            extracted (cache path only; a fallback clone checks out fully).
+
+    Returns the materialized commit SHA when known.
+    """
+    cache = _get_cache()
+    if cache is not None:
+        try:
+            with _lock_for(url):
+                return cache.materialize(url, dest, ref, paths=paths)
+        except OSError:
+            pass  # unwritable or corrupt cache — pay for a direct clone
+    _clone(url, dest, ref=ref)
+    return _read_head_sha(dest)
+
+
+def _read_head_sha(repo_dir: Path) -> str | None:
+    """Resolve HEAD of a freshly cloned working tree without forking git.
+
+    HEAD is either a bare SHA (detached) or a symref into refs/ or
+    packed-refs; both are single small-file reads.
+    """
+    git_dir = repo_dir / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not head.startswith("ref: "):
+        return head or None
+    ref = head[5:]
+    sha = _read_ref_file(git_dir / ref)
+    if sha is not None:
+        return sha
+    try:
+        packed = (git_dir / "packed-refs").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    for line in packed.splitlines():
+        if line[:1] in ("#", "^"):
+            continue
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return None
+
+
+def _read_ref_file(path: Path) -> str | None:
+    """Read the leading 40-hex-char SHA from a loose ref or FETCH_HEAD."""
+    try:
+        sha = path.read_text(encoding="utf-8")[:40]
+    except OSError:
+        return None
+    if len(sha) == 40 and all(c in "0123456789abcdef" for c in sha):
+        return sha
+    return None
+
+
+class _GitCache:
+    """Persistent bare-repo cache, one directory per fetched URL."""
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+
+    def materialize(
+        self,
+        url: str,
+        dest: Path,
+        ref: str | None,
+        paths: tuple[str, ...] | None = None,
+    ) -> str:
+        """Fetch url into its bare cache entry and extract the tree at dest.
+
+        Extraction goes through `git archive` piped into tarfile, so no
+        working-tree checkout is ever created inside the cache; with paths
+        given, only those pathspecs are archived at all.
+        """
+        bare = self._root / hashlib.sha1(url.encode("utf-8")).hexdigest()
+        if not (bare / "HEAD").exists():
+            bare.mkdir(parents=True, exist_ok=True)
+            _run_git(["git", "init", "-q", "--bare", str(bare)], url)
+        _run_git(
+            [
+                "git",
+                "--git-dir",
+                str(bare),
+                "fetch",
+                "--depth",
+                "1",
+                "--no-tags",
+                url,
+                ref or "HEAD",
+            ],
+            url,
+        )
+        archive_cmd = ["git", "--git-dir", str(bare), "archive", "--format=tar", "FETCH_HEAD"]
+        if paths:
+            try:
+                archive = _run_git([*archive_cmd, "--", *paths], url)
+            except FetchError:
+                # Pathspec absent from this repo — archive the full tree and
+                # let the manifest loader report what's missing.
+                archive = _run_git(archive_cmd, url)
+        else:
+            archive = _run_git(archive_cmd, url)
+        with tarfile.open(fileobj=io.BytesIO(archive.stdout)) as tar:
+            try:
+                tar.extractall(dest, filter="data")
+            except TypeError:
+                # Older Pythons without the extraction-filter API
+                tar.extractall(dest)
+        head = _read_ref_file(bare / "FETCH_HEAD")
+        if head is None:
+            head = (
+                _run_git(["git", "--git-dir", str(bare), "rev-parse", "FETCH_HEAD"], url)
+                .stdout[:40]
+                .decode("ascii", "replace")
+            )
+        return head
+
+
+_cache: _GitCache | None = None
+
+# One lock per URL: concurrent fetches of the same repo would race on its
+# bare cache entry; the loser of the race re-fetches against up-to-date
+# objects, which the negotiation turns into a near no-op.
+_url_locks: dict[str, threading.Lock] = {}
+_url_locks_guard = threading.Lock()
+
+
+def _lock_for(url: str) -> threading.Lock:
+    with _url_locks_guard:
+        lock = _url_locks.get(url)
+        if lock is None:
+            lock = _url_locks[url] = threading.Lock()
+        return lock
+
+
+def _get_cache() -> _GitCache | None:
+    """Return the shared cache, or None when no cache directory is writable."""
+    global _cache
+    if _cache is None:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        base = Path(xdg) if xdg else Path.home() / ".cache"
+        root = base / "claude-code-plugins-sdk" / "git"
+        try:
+            root.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return None
+        _cache = _GitCache(root)
+    return _cache
+
+
+def _git_verb(cmd: list[str]) -> str:
+    """The git subcommand in cmd, skipping global options and their values.
+
+    Keeps failure messages naming the verb ("git fetch failed ...") even
+    when the argv leads with --git-dir or -c option pairs.
+    """
+    args = iter(cmd[1:])
+    for tok in args:
+        if tok in ("--git-dir", "-C", "-c"):
+            next(args, None)
+        elif not tok.startswith("-"):
+            return tok
+    return "command"
+
+
+def _run_git(cmd: list[str], url: str, timeout: int = 120) -> subprocess.CompletedProcess[bytes]:
+    try:
+        # Never let git stall the timeout waiting on a credential prompt.
+        env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+        result = subprocess.run(
+            cmd, capture_output=True, stdin=subprocess.DEVNULL, timeout=timeout, env=env
+        )
+    except subprocess.TimeoutExpired as e:
+        raise FetchError(f"git timed out for {url}", url=url) from e
+    except FileNotFoundError as e:
+        raise FetchError("git is not installed or not in PATH", url=url) from e
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", "replace").strip()
+        raise FetchError(f"git {_git_verb(cmd)} failed for {url}: {stderr}", url=url)
+    return result
+
+
 def _clone(url: str, dest: Path, ref: str | None) -> None:
-    cmd = ["git", "clone", "--depth", "1"]
+    if _clone_pygit2(url, dest, ref):
+        return
+    # Partial single-branch clone: skip refs we don't follow, tags, and blobs
+    # outside the checked-out tree; protocol v2 keeps the refs advertisement
+    # small. Blobs needed for the checkout are fetched lazily from origin.
+    cmd = [
+        "git",
+        "-c",
+        "protocol.version=2",
+        "clone",
+        "--depth",
+        "1",
+        "--single-branch",
+        "--no-tags",
+        "--filter=blob:none",
+    ]
     if ref:
         cmd += ["--branch", ref]
     cmd += [url, str(dest)]
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+        # No text=True: stderr is only looked at on failure, so successful
+        # clones skip the decode entirely; DEVNULL stdin doubles down on git
+        # never stalling for input.
+        result = subprocess.run(
+            cmd, capture_output=True, stdin=subprocess.DEVNULL, timeout=120, env=env
+        )
     except subprocess.TimeoutExpired as e:
         raise FetchError(f"git clone timed out for {url}", url=url) from e
     except FileNotFoundError as e:
         raise FetchError("git is not installed or not in PATH", url=url) from e
     if result.returncode != 0:
-        raise FetchError(f"git clone failed for {url}: {result.stderr.strip()}", url=url)
+        stderr = result.stderr.decode("utf-8", "replace").strip()
+        raise FetchError(f"git clone failed for {url}: {stderr}", url=url)
+
+
+def _clone_pygit2(url: str, dest: Path, ref: str | None) -> bool:
+    """Shallow-clone in-process via libgit2 when the optional pygit2 extra is
+    installed, skipping the fork/exec and stderr-capture cost of the git CLI.
+
+    Returns False when pygit2 is unavailable so callers fall back to the
+    subprocess path.
+    """
+    try:
+        import pygit2
+    except ImportError:
+        return False
+    try:
+        pygit2.clone_repository(url, str(dest), checkout_branch=ref, depth=1)
+    except pygit2.GitError as e:
+        raise FetchError(f"git clone failed for {url}: {e}", url=url) from e
+    return True
 
 
-def _verify_sha(repo_dir: Path, expected_sha: str, url: str) -> None:
-    result = subprocess.run(
-        ["git", "-C", str(repo_dir), "rev-parse", "HEAD"],
-        capture_output=True,
-        text=True,
-    )
-    actual = result.stdout.strip()
-    if not actual.startswith(expected_sha[:7]):
+def _verify_sha(actual: str | None, expected_sha: str, url: str) -> None:
+    if not (actual or "").startswith(expected_sha[:7]):
         raise FetchError(
-            f"SHA mismatch: expected {expected_sha[:7]}…, got {actual[:7]}…",
+            f"SHA mismatch: expected {expected_sha[:7]}…, got {(actual or '')[:7]}…",
             url=url,
         )
@@ -1,24 +1,93 @@
 from __future__ import annotations
 
-import httpx
+import atexit
+import threading
+from typing import TYPE_CHECKING
+
+from pydantic import ValidationError
 
 from ..errors import FetchError
 from ..models.marketplace import MarketplaceManifest
 
+if TYPE_CHECKING:
+    import httpx
+
+# Created on first fetch; importing this module must not pull in httpx (and
+# its anyio/h11/certifi tail), which costs real time for CLIs that never
+# touch the network.
+_client: httpx.Client | None = None
+
+# Conditional-request cache: url -> (etag, last_modified, manifest). Entries
+# exist only for servers that returned a validator, so revalidation costs a
+# headers-only 304 instead of a full body transfer and re-parse.
+_revalidated: dict[str, tuple[str | None, str | None, MarketplaceManifest]] = {}
+_revalidated_guard = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use.
+
+    A persistent client keeps connections alive between requests, so repeated
+    fetches against the same host skip the TCP and TLS handshakes. HTTP/2 is
+    enabled when the optional h2 package is installed.
+    """
+    global _client
+    if _client is None:
+        import httpx
+
+        try:
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:
+            http2 = False
+        _client = httpx.Client(
+            follow_redirects=True,
+            timeout=30,
+            http2=http2,
+            limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60),
+        )
+        atexit.register(_client.close)
+    return _client
+
 
 def fetch_via_http(url: str) -> MarketplaceManifest:
     """Fetch and parse a marketplace.json from a direct HTTPS URL."""
+    import httpx
+
+    with _revalidated_guard:
+        cached = _revalidated.get(url)
+    headers = {}
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
     try:
-        response = httpx.get(url, follow_redirects=True, timeout=30)
-        response.raise_for_status()
+        with _get_client().stream("GET", url, headers=headers) as response:
+            if cached is not None and response.status_code == 304:
+                return cached[2].model_copy(deep=True)
+            response.raise_for_status()
+            body = response.read()
     except httpx.HTTPStatusError as e:
         raise FetchError(f"HTTP {e.response.status_code} fetching {url}", url=url) from e
     except httpx.HTTPError as e:
         raise FetchError(f"Network error fetching {url}: {e}", url=url) from e
 
+    # Validate the raw bytes in one pass inside pydantic's parser rather than
+    # decoding to a dict first and re-walking it with model_validate.
     try:
-        data = response.json()
-    except Exception as e:
-        raise FetchError(f"Invalid JSON at {url}: {e}", url=url) from e
+        manifest = MarketplaceManifest.model_validate_json(body)
+    except ValidationError as e:
+        if any(err.get("type") == "json_invalid" for err in e.errors()):
+            raise FetchError(f"Invalid JSON at {url}: {e}", url=url) from e
+        raise
 
-    return MarketplaceManifest.model_validate(data)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        with _revalidated_guard:
+            _revalidated[url] = (etag, last_modified, manifest)
+    return manifest
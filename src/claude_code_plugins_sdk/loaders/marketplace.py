@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING
+import os
+import stat
+from functools import lru_cache
+from pathlib import Path
 
+from .. import _json
 from ..errors import LoadError
-
-if TYPE_CHECKING:
-    from pathlib import Path
 from ..models.marketplace import MarketplaceManifest
 
 
@@ -23,23 +23,42 @@ def load_marketplace(path: Path) -> MarketplaceManifest:
     Raises:
         LoadError: If the file is missing or contains invalid JSON.
     """
-    resolved = _resolve_marketplace_path(path)
-    try:
-        data = json.loads(resolved.read_text(encoding="utf-8"))
-    except FileNotFoundError as e:
-        raise LoadError(f"Marketplace file not found: {resolved}", path=resolved) from e
-    except json.JSONDecodeError as e:
-        raise LoadError(f"Invalid JSON in {resolved}: {e}", path=resolved) from e
-    return MarketplaceManifest.model_validate(data)
+    resolved, st = _resolve_marketplace_path(path)
+    cached = _load_marketplace_cached(str(resolved), st.st_mtime_ns, st.st_size)
+    return cached.model_copy(deep=True)
 
 
-def _resolve_marketplace_path(path: Path) -> Path:
-    if path.is_file():
-        return path
-    candidate = path / ".claude-plugin" / "marketplace.json"
-    if candidate.exists():
-        return candidate
-    raise LoadError(
-        f"No marketplace.json found at {path} or {candidate}",
-        path=path,
+@lru_cache(maxsize=256)
+def _load_marketplace_cached(path_str: str, mtime_ns: int, size: int) -> MarketplaceManifest:
+    """Parse and validate a manifest, memoized on the file's stat signature.
+
+    Repeat loads of an unchanged file (refresh, list, update checks) collapse
+    to a stat call plus a copy; callers get a private deep copy so nothing can
+    mutate the cached instance.
+    """
+    resolved = Path(path_str)
+    return _json.validate_json(
+        MarketplaceManifest.model_validate_json, resolved.read_bytes(), resolved
     )
+
+
+def _resolve_marketplace_path(path: Path) -> tuple[Path, os.stat_result]:
+    """Resolve path to a manifest file, returning it with its stat result.
+
+    One stat serves both resolution and the cache key, instead of separate
+    is_file/exists probes followed by a re-stat.
+    """
+    try:
+        st = path.stat()
+        if not stat.S_ISDIR(st.st_mode):
+            return path, st
+    except OSError:
+        pass
+    candidate = path / ".claude-plugin" / "marketplace.json"
+    try:
+        return candidate, candidate.stat()
+    except OSError as e:
+        raise LoadError(
+            f"No marketplace.json found at {path} or {candidate}",
+            path=path,
+        ) from e
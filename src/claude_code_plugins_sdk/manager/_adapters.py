@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import tempfile
 from contextlib import contextmanager
@@ -10,23 +11,56 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from pydantic import TypeAdapter, ValidationError
+
+from .. import _json as _jsonc
 from ..errors import FetchError
 from ..models.marketplace import GitHubSource, HTTPSource, URLSource
 from ..models.state import BlocklistFile, KnownMarketplaceEntry
 
+# Compiled once; validates and serializes the whole known-marketplaces
+# mapping in single calls — the discriminated source union is resolved inside
+# pydantic-core rather than once per entry, and Path and datetime fields are
+# emitted JSON-safe by pydantic itself.
+_KNOWN_ADAPTER = TypeAdapter(dict[str, KnownMarketplaceEntry])
+
+
+# Tempdir paths owned by the fetch context managers below. store_cache and
+# store_plugin_cache may consume these with a rename instead of copying;
+# any path not registered here (e.g. a user's directory source) is copied.
+_disposable_dirs: set[str] = set()
+
+
+def _atomic_write(path: Path, data: str | bytes) -> None:
+    """Write data to path atomically and durably.
 
-def _atomic_write(path: Path, data: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+    The payload is fsynced before the rename so a crash can't leave a
+    truncated temp file behind the swap, and the parent directory entry is
+    fsynced after it (where the platform allows opening directories) so the
+    rename itself survives power loss.
+    """
+    os.makedirs(path.parent, exist_ok=True)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(data, encoding="utf-8")
-    tmp.replace(path)
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+    if hasattr(os, "O_DIRECTORY"):  # not available on Windows
+        dirfd = os.open(path.parent, os.O_DIRECTORY)
+        try:
+            os.fsync(dirfd)
+        finally:
+            os.close(dirfd)
 
 
 def _load_json(path: Path, default: dict[str, Any] | list[Any]) -> dict[str, Any] | list[Any]:
-    if not path.exists():
-        return default
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _jsonc.loads(path.read_bytes())
     except (json.JSONDecodeError, OSError):
         return default
 
@@ -42,6 +76,18 @@ class LocalFilesystemMarketplaceAdapter:
         self._plugin_cache_dir = self._dir / "plugin-cache"
 
     def get_marketplaces(self) -> dict[str, KnownMarketplaceEntry]:
+        try:
+            raw_bytes = self._marketplaces_file.read_bytes()
+        except OSError:
+            return {}
+        try:
+            # Whole file in one validate_json call: pydantic-core walks the
+            # JSON directly without materializing an intermediate dict.
+            return _KNOWN_ADAPTER.validate_json(raw_bytes)
+        except ValidationError:
+            pass
+        # Lenient fallback for files with stray non-entry values: keep what
+        # parses, skip what doesn't, as the per-entry path always did.
         raw = _load_json(self._marketplaces_file, {})
         if not isinstance(raw, dict):
             return {}
@@ -52,13 +98,10 @@ class LocalFilesystemMarketplaceAdapter:
         }
 
     def set_marketplaces(self, data: dict[str, KnownMarketplaceEntry]) -> None:
-        out = {k: v.model_dump(by_alias=True, exclude_none=False) for k, v in data.items()}
-        for v in out.values():
-            if "installLocation" in v:
-                v["installLocation"] = str(v["installLocation"])
-            if "lastUpdated" in v and hasattr(v["lastUpdated"], "isoformat"):
-                v["lastUpdated"] = v["lastUpdated"].isoformat()
-        _atomic_write(self._marketplaces_file, json.dumps(out, indent=2))
+        _atomic_write(
+            self._marketplaces_file,
+            _KNOWN_ADAPTER.dump_json(data, by_alias=True, exclude_none=False, indent=2),
+        )
 
     def get_blocklist(self) -> BlocklistFile:
         raw = _load_json(self._blocklist_file, {"fetchedAt": "1970-01-01T00:00:00Z", "plugins": []})
@@ -77,7 +120,7 @@ class LocalFilesystemMarketplaceAdapter:
         self._cache_dir.mkdir(parents=True, exist_ok=True)
         if dest.exists():
             shutil.rmtree(dest)
-        shutil.copytree(source_path, dest)
+        _move_or_copy(source_path, dest)
         return dest
 
     def delete_cache(self, name: str) -> None:
@@ -90,7 +133,7 @@ class LocalFilesystemMarketplaceAdapter:
         dest.parent.mkdir(parents=True, exist_ok=True)
         if dest.exists():
             shutil.rmtree(dest)
-        shutil.copytree(source_path, dest)
+        _move_or_copy(source_path, dest)
         return dest
 
     def get_plugin_cache_path(self, marketplace: str, plugin_name: str) -> Path:
@@ -122,7 +165,19 @@ class LocalFilesystemSettingsAdapter:
         if not isinstance(raw, dict):
             raw = {}
         raw["enabledPlugins"] = data
-        _atomic_write(self._path, json.dumps(raw, indent=2))
+        _atomic_write(self._path, _jsonc.dumps_indented(raw))
+
+
+def _move_or_copy(source_path: Path, dest: Path) -> None:
+    """Move a throwaway fetch tempdir into place, or copy anything else.
+
+    A move is a single rename on the same filesystem (shutil.move falls back
+    to a copy across devices) versus copytree's per-file reads and writes.
+    """
+    if str(source_path) in _disposable_dirs:
+        shutil.move(str(source_path), str(dest))
+    else:
+        shutil.copytree(source_path, dest)
 
 
 def _default_blocklist() -> BlocklistFile:
@@ -137,11 +192,15 @@ def _detect_source(s: str) -> GitHubSource | URLSource | HTTPSource:
 
 @contextmanager
 def _fetch_git(url: str, ref: str | None):
-    from ..fetchers._git import _clone
+    from ..fetchers._git import materialize_repo
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        _clone(url, Path(tmpdir), ref=ref)
-        yield Path(tmpdir)
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmpdir:
+        materialize_repo(url, Path(tmpdir), ref=ref)
+        _disposable_dirs.add(tmpdir)
+        try:
+            yield Path(tmpdir)
+        finally:
+            _disposable_dirs.discard(tmpdir)
 
 
 @contextmanager
@@ -149,14 +208,18 @@ def _fetch_http(url: str):
     from ..fetchers._http import fetch_via_http
 
     manifest = fetch_via_http(url)
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmpdir:
         p = Path(tmpdir)
         (p / ".claude-plugin").mkdir()
         (p / ".claude-plugin" / "marketplace.json").write_text(
             manifest.model_dump_json(by_alias=True, exclude_none=False),
             encoding="utf-8",
         )
-        yield p
+        _disposable_dirs.add(tmpdir)
+        try:
+            yield p
+        finally:
+            _disposable_dirs.discard(tmpdir)
 
 
 class DefaultFetchAdapter:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 import tempfile
 from pathlib import Path
@@ -9,6 +10,19 @@ from pathlib import Path
 from ..models.state import BlocklistFile, KnownMarketplaceEntry
 
 
+def _link_or_copy(src: str, dst: str, *, follow_symlinks: bool = True) -> None:
+    """copytree copy_function that hardlinks instead of copying bytes.
+
+    The populated tree is read-only for its lifetime, so aliasing the source
+    inodes is safe and turns population into metadata-only syscalls; cross-
+    device links (and other link failures) fall back to a real copy.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
+
 def _default_blocklist() -> BlocklistFile:
     from datetime import datetime, timezone
 
@@ -25,6 +39,10 @@ class InMemoryMarketplaceAdapter:
         self._blocklist = blocklist if blocklist is not None else _default_blocklist()
         self._cache: dict[str, dict] = {}
         self._plugin_cache: dict[tuple[str, str], Path] = {}
+        # Placeholder paths for plugins without a populated cache, built once
+        # per (marketplace, plugin) so repeated lookups return the same object
+        # instead of re-joining components.
+        self._plugin_cache_placeholders: dict[tuple[str, str], Path] = {}
         self._plugin_cache_tmpdirs: list[tempfile.TemporaryDirectory] = []
 
     def get_marketplaces(self) -> dict[str, KnownMarketplaceEntry]:
@@ -53,14 +71,19 @@ class InMemoryMarketplaceAdapter:
         tmpdir = tempfile.TemporaryDirectory()
         self._plugin_cache_tmpdirs.append(tmpdir)
         dest = Path(tmpdir.name) / plugin_name
-        shutil.copytree(source_path, dest)
+        shutil.copytree(source_path, dest, copy_function=_link_or_copy)
         self._plugin_cache[(marketplace, plugin_name)] = dest
         return dest
 
     def get_plugin_cache_path(self, marketplace: str, plugin_name: str) -> Path:
-        if (marketplace, plugin_name) in self._plugin_cache:
-            return self._plugin_cache[(marketplace, plugin_name)]
-        return Path(f"/in-memory/plugin-cache/{marketplace}/{plugin_name}")
+        key = (marketplace, plugin_name)
+        if key in self._plugin_cache:
+            return self._plugin_cache[key]
+        path = self._plugin_cache_placeholders.get(key)
+        if path is None:
+            path = Path(f"/in-memory/plugin-cache/{marketplace}/{plugin_name}")
+            self._plugin_cache_placeholders[key] = path
+        return path
 
     def delete_plugin_cache(self, marketplace: str, plugin_name: str) -> None:
         path = self._plugin_cache.pop((marketplace, plugin_name), None)
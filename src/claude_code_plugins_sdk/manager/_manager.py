@@ -2,23 +2,40 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Literal
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Literal
 
 from ..errors import (
     AlreadyInstalledError,
+    FetchError,
     MarketplaceNotFoundError,
     NotInstalledError,
     PluginBlockedError,
     PluginNotFoundError,
 )
+from ..fetchers._dispatcher import _detect
 from ..loaders.marketplace import load_marketplace
-from ..models.marketplace import MarketplaceManifest
+from ..loaders.plugin import _load_optional_manifest
+from ..models.marketplace import (
+    GitHubSource,
+    HTTPSource,
+    MarketplaceManifest,
+    NPMSource,
+    PIPSource,
+    PluginEntry,
+    URLSource,
+)
 from ..models.state import (
     BlocklistFile,
+    DirectoryMarketplaceSource,
     GitHubMarketplaceSource,
     GitMarketplaceSource,
+    HostPatternMarketplaceSource,
     HttpMarketplaceSource,
     KnownMarketplaceEntry,
 )
@@ -26,8 +43,14 @@ from ._protocols import FetchAdapter, MarketplaceStateAdapter, PluginSettingsAda
 
 Scope = Literal["user", "project", "local"]
 
+_UTC = timezone.utc
+
+
+def _now() -> datetime:
+    return datetime.now(_UTC)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class InstalledPlugin:
     name: str
     marketplace: str
@@ -39,7 +62,7 @@ class InstalledPlugin:
         return f"{self.name}@{self.marketplace}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UpdateCheckResult:
     plugin_name: str
     marketplace: str
@@ -48,35 +71,49 @@ class UpdateCheckResult:
     has_update: bool
 
 
+@lru_cache(maxsize=4096)
 def _plugin_key(plugin_name: str, marketplace: str) -> str:
+    """Build the settings key, memoized: hot paths re-key the same few
+    plugins constantly, so repeats resolve in the cache instead of
+    allocating a fresh string each time."""
     return f"{plugin_name}@{marketplace}"
 
 
+# type -> converter, built on first use. A dict lookup on type() replaces a
+# chain of up to eight isinstance checks per conversion.
+_state_source_converters: dict[type, Callable[[Any], Any]] | None = None
+
+
+def _get_state_source_converters() -> dict[type, Callable[[Any], Any]]:
+    global _state_source_converters
+    if _state_source_converters is None:
+
+        def _identity(s: Any) -> Any:
+            return s
+
+        _state_source_converters = {
+            GitHubSource: lambda s: GitHubMarketplaceSource(
+                source="github", repo=s.repo, ref=s.ref
+            ),
+            URLSource: lambda s: GitMarketplaceSource(source="git", url=s.url, ref=s.ref),
+            HTTPSource: lambda s: HttpMarketplaceSource(source="http", url=s.url),
+            GitHubMarketplaceSource: _identity,
+            GitMarketplaceSource: _identity,
+            HttpMarketplaceSource: _identity,
+            DirectoryMarketplaceSource: _identity,
+            HostPatternMarketplaceSource: _identity,
+        }
+    return _state_source_converters
+
+
 def _source_to_state_source(source: object):
     """Convert fetcher source types to state AnyMarketplaceSource."""
-    from ..fetchers._dispatcher import _detect
-    from ..models.marketplace import GitHubSource, HTTPSource, URLSource
-    from ..models.state import DirectoryMarketplaceSource, HostPatternMarketplaceSource
-
     if isinstance(source, str):
         source = _detect(source)
-    if isinstance(source, GitHubSource):
-        return GitHubMarketplaceSource(source="github", repo=source.repo, ref=source.ref)
-    if isinstance(source, URLSource):
-        return GitMarketplaceSource(source="git", url=source.url, ref=source.ref)
-    if isinstance(source, HTTPSource):
-        return HttpMarketplaceSource(source="http", url=source.url)
-    if isinstance(source, GitHubMarketplaceSource):
-        return source
-    if isinstance(source, GitMarketplaceSource):
-        return source
-    if isinstance(source, HttpMarketplaceSource):
-        return source
-    if isinstance(source, DirectoryMarketplaceSource):
-        return source
-    if isinstance(source, HostPatternMarketplaceSource):
-        return source
-    raise ValueError(f"Cannot convert source to state format: {type(source)}")
+    converter = _get_state_source_converters().get(type(source))
+    if converter is None:
+        raise ValueError(f"Cannot convert source to state format: {type(source)}")
+    return converter(source)
 
 
 class PluginManager:
@@ -89,6 +126,89 @@ class PluginManager:
         self._state = marketplace_state
         self._settings = settings
         self._fetcher = fetcher
+        # (plugin_name, marketplace) -> resolved plugin directory (or None).
+        # Populated by the agent runtime's directory resolution and cleared
+        # whenever installs or marketplace caches change.
+        self._plugin_dir_cache: dict[tuple[str, str], Path | None] = {}
+        # In-memory views of adapter state, filled lazily and kept in step on
+        # every write, so bulk operations (check_all_updates and friends)
+        # don't re-read and re-parse the same files per plugin.
+        self._marketplaces_cache: dict[str, KnownMarketplaceEntry] | None = None
+        self._blocklist_cache: BlocklistFile | None = None
+        # marketplace name -> {plugin name: entry}, so repeated lookups don't
+        # rescan manifest.plugins linearly per call.
+        self._plugin_index: dict[str, dict[str, PluginEntry]] = {}
+        self._enabled_cache: dict[Scope, dict[str, bool]] = {}
+        # settings key -> (name, marketplace), or None for malformed keys.
+        # Parsing is a pure function of the string, so entries never expire.
+        self._parsed_keys: dict[str, tuple[str, str] | None] = {}
+        # Merged cross-scope views, rebuilt after writes: every key that
+        # appears in any scope, and the subset enabled (True) somewhere.
+        # Frozensets instead of a key -> bool dict: the only merged reads are
+        # membership tests, and a set skips the per-entry bool pointer.
+        self._installed_keys: frozenset[str] | None = None
+        self._enabled_keys: frozenset[str] | None = None
+
+    def _get_marketplaces(self) -> dict[str, KnownMarketplaceEntry]:
+        if self._marketplaces_cache is None:
+            self._marketplaces_cache = self._state.get_marketplaces()
+        return self._marketplaces_cache
+
+    def _set_marketplaces(self, data: dict[str, KnownMarketplaceEntry]) -> None:
+        self._state.set_marketplaces(data)
+        self._marketplaces_cache = data
+
+    def _get_blocklist(self) -> BlocklistFile:
+        if self._blocklist_cache is None:
+            self._blocklist_cache = self._state.get_blocklist()
+        return self._blocklist_cache
+
+    def _get_blocked_keys(self) -> frozenset[str]:
+        return self._get_blocklist().blocked_keys
+
+    def _get_enabled(self, scope: Scope) -> dict[str, bool]:
+        cached = self._enabled_cache.get(scope)
+        if cached is None:
+            cached = self._enabled_cache[scope] = self._settings_for(scope).get_enabled_plugins()
+        return cached
+
+    def _set_enabled(self, scope: Scope, plugins: dict[str, bool]) -> None:
+        self._settings_for(scope).set_enabled_plugins(plugins)
+        self._enabled_cache[scope] = plugins
+        self._installed_keys = None
+        self._enabled_keys = None
+
+    def _rebuild_merged_keys(self) -> tuple[frozenset[str], frozenset[str]]:
+        installed: set[str] = set()
+        enabled: set[str] = set()
+        for sc in self._settings:
+            for key, value in self._get_enabled(sc).items():
+                installed.add(key)
+                if value is True:
+                    enabled.add(key)
+        self._installed_keys = frozenset(installed)
+        self._enabled_keys = frozenset(enabled)
+        return self._installed_keys, self._enabled_keys
+
+    def _get_installed_keys(self) -> frozenset[str]:
+        if self._installed_keys is None:
+            return self._rebuild_merged_keys()[0]
+        return self._installed_keys
+
+    def _get_enabled_keys(self) -> frozenset[str]:
+        if self._enabled_keys is None:
+            return self._rebuild_merged_keys()[1]
+        return self._enabled_keys
+
+    def _parse_key(self, key: str) -> tuple[str, str] | None:
+        try:
+            return self._parsed_keys[key]
+        except KeyError:
+            pass
+        name, sep, mkt = key.rpartition("@")
+        parsed = (name, mkt) if sep else None
+        self._parsed_keys[key] = parsed
+        return parsed
 
     def _settings_for(self, scope: Scope) -> PluginSettingsAdapter:
         adapter = self._settings.get(scope)
@@ -102,9 +222,6 @@ class PluginManager:
         name: str | None = None,
         ref: str | None = None,
     ) -> KnownMarketplaceEntry:
-        from ..fetchers._dispatcher import _detect
-        from ..models.marketplace import GitHubSource, URLSource
-
         fetch_source: object = source
         if isinstance(source, str):
             fetch_source = _detect(source)
@@ -121,73 +238,81 @@ class PluginManager:
 
         state_source = _source_to_state_source(fetch_source)
 
-        now = datetime.now(timezone.utc)
+        now = _now()
         entry = KnownMarketplaceEntry(
             source=state_source,
             installLocation=cache_path,
             lastUpdated=now,
         )
-        all_marketplaces = self._state.get_marketplaces()
+        all_marketplaces = self._get_marketplaces()
         all_marketplaces[resolved_name] = entry
-        self._state.set_marketplaces(all_marketplaces)
+        self._set_marketplaces(all_marketplaces)
+        self._plugin_dir_cache.clear()
+        self._plugin_index.pop(resolved_name, None)
         return entry
 
     def remove_marketplace(self, name: str) -> None:
-        all_marketplaces = self._state.get_marketplaces()
+        all_marketplaces = self._get_marketplaces()
         if name not in all_marketplaces:
             raise MarketplaceNotFoundError(name)
         self._state.delete_cache(name)
         del all_marketplaces[name]
-        self._state.set_marketplaces(all_marketplaces)
+        self._set_marketplaces(all_marketplaces)
+        self._plugin_dir_cache.clear()
+        self._plugin_index.pop(name, None)
 
     def list_marketplaces(self) -> dict[str, KnownMarketplaceEntry]:
-        return self._state.get_marketplaces()
+        return self._get_marketplaces()
 
     def refresh_marketplace(self, name: str) -> MarketplaceManifest:
-        all_marketplaces = self._state.get_marketplaces()
+        all_marketplaces = self._get_marketplaces()
         if name not in all_marketplaces:
             raise MarketplaceNotFoundError(name)
         entry = all_marketplaces[name]
         with self._fetcher.fetch(entry.source) as path:
             manifest = load_marketplace(path)
-            self._state.store_cache(name, path)
-        now = datetime.now(timezone.utc)
+            cache_path = self._state.store_cache(name, path)
+        now = _now()
         entry = KnownMarketplaceEntry(
             source=entry.source,
-            installLocation=self._state.get_cache_path(name),
+            installLocation=cache_path,
             lastUpdated=now,
         )
         all_marketplaces[name] = entry
-        self._state.set_marketplaces(all_marketplaces)
+        self._set_marketplaces(all_marketplaces)
+        self._plugin_dir_cache.clear()
+        self._plugin_index.pop(name, None)
         return manifest
 
     def get_marketplace_manifest(self, name: str) -> MarketplaceManifest:
-        all_marketplaces = self._state.get_marketplaces()
+        all_marketplaces = self._get_marketplaces()
         if name not in all_marketplaces:
             raise MarketplaceNotFoundError(name)
         return load_marketplace(self._state.get_cache_path(name))
 
+    def _manifest_plugin_index(self, marketplace: str) -> dict[str, PluginEntry]:
+        index = self._plugin_index.get(marketplace)
+        if index is None:
+            manifest = self.get_marketplace_manifest(marketplace)
+            index = self._plugin_index[marketplace] = {p.name: p for p in manifest.plugins}
+        return index
+
     def install(
         self,
         plugin_name: str,
         marketplace: str,
         scope: Scope = "user",
     ) -> None:
-        from ..errors import FetchError
-        from ..models.marketplace import NPMSource, PIPSource
-
         key = _plugin_key(plugin_name, marketplace)
         if self.is_blocked(plugin_name, marketplace):
             raise PluginBlockedError(key)
-        all_marketplaces = self._state.get_marketplaces()
+        all_marketplaces = self._get_marketplaces()
         if marketplace not in all_marketplaces:
             raise MarketplaceNotFoundError(marketplace)
-        manifest = self.get_marketplace_manifest(marketplace)
-        entry = next((p for p in manifest.plugins if p.name == plugin_name), None)
+        entry = self._manifest_plugin_index(marketplace).get(plugin_name)
         if entry is None:
             raise PluginNotFoundError(plugin_name, marketplace)
-        adapter = self._settings_for(scope)
-        plugins = adapter.get_enabled_plugins()
+        plugins = self._get_enabled(scope)
         if key in plugins:
             raise AlreadyInstalledError(key)
 
@@ -200,7 +325,8 @@ class PluginManager:
                 self._state.store_plugin_cache(marketplace, plugin_name, plugin_path)
 
         plugins[key] = True
-        adapter.set_enabled_plugins(plugins)
+        self._set_enabled(scope, plugins)
+        self._plugin_dir_cache.pop((plugin_name, marketplace), None)
 
     def uninstall(
         self,
@@ -209,12 +335,12 @@ class PluginManager:
         scope: Scope = "user",
     ) -> None:
         key = _plugin_key(plugin_name, marketplace)
-        adapter = self._settings_for(scope)
-        plugins = adapter.get_enabled_plugins()
+        plugins = self._get_enabled(scope)
         if key not in plugins:
             raise NotInstalledError(key)
         del plugins[key]
-        adapter.set_enabled_plugins(plugins)
+        self._set_enabled(scope, plugins)
+        self._plugin_dir_cache.pop((plugin_name, marketplace), None)
         if not self.is_installed(plugin_name, marketplace):
             self._state.delete_plugin_cache(marketplace, plugin_name)
 
@@ -225,12 +351,11 @@ class PluginManager:
         scope: Scope = "user",
     ) -> None:
         key = _plugin_key(plugin_name, marketplace)
-        adapter = self._settings_for(scope)
-        plugins = adapter.get_enabled_plugins()
+        plugins = self._get_enabled(scope)
         if key not in plugins:
             raise NotInstalledError(key)
         plugins[key] = True
-        adapter.set_enabled_plugins(plugins)
+        self._set_enabled(scope, plugins)
 
     def disable(
         self,
@@ -239,12 +364,11 @@ class PluginManager:
         scope: Scope = "user",
     ) -> None:
         key = _plugin_key(plugin_name, marketplace)
-        adapter = self._settings_for(scope)
-        plugins = adapter.get_enabled_plugins()
+        plugins = self._get_enabled(scope)
         if key not in plugins:
             raise NotInstalledError(key)
         plugins[key] = False
-        adapter.set_enabled_plugins(plugins)
+        self._set_enabled(scope, plugins)
 
     def list_installed(
         self,
@@ -253,40 +377,48 @@ class PluginManager:
         result: list[InstalledPlugin] = []
         scopes_to_use: list[Scope] = list(self._settings.keys()) if scope == "all" else [scope]
         for sc in scopes_to_use:
-            adapter = self._settings.get(sc)
-            if adapter is None:
+            if self._settings.get(sc) is None:
                 continue
-            for key, enabled in adapter.get_enabled_plugins().items():
-                if "@" not in key:
+            for key, enabled in self._get_enabled(sc).items():
+                parsed = self._parse_key(key)
+                if parsed is None:
                     continue
-                name, mkt = key.rsplit("@", 1)
+                name, mkt = parsed
                 result.append(
                     InstalledPlugin(name=name, marketplace=mkt, enabled=enabled, scope=sc)
                 )
         return result
 
     def is_installed(self, plugin_name: str, marketplace: str) -> bool:
-        key = _plugin_key(plugin_name, marketplace)
-        return any(key in adapter.get_enabled_plugins() for adapter in self._settings.values())
+        return _plugin_key(plugin_name, marketplace) in self._get_installed_keys()
 
     def is_enabled(self, plugin_name: str, marketplace: str) -> bool:
-        key = _plugin_key(plugin_name, marketplace)
-        for adapter in self._settings.values():
-            plugins = adapter.get_enabled_plugins()
-            if plugins.get(key) is True:
-                return True
-        return False
+        return _plugin_key(plugin_name, marketplace) in self._get_enabled_keys()
 
     def is_blocked(self, plugin_name: str, marketplace: str) -> bool:
-        key = _plugin_key(plugin_name, marketplace)
-        return any(entry.plugin == key for entry in self._state.get_blocklist().plugins)
+        return _plugin_key(plugin_name, marketplace) in self._get_blocked_keys()
 
     def get_blocklist(self) -> BlocklistFile:
-        return self._state.get_blocklist()
+        return self._get_blocklist()
 
     def check_update(self, plugin_name: str, marketplace: str) -> UpdateCheckResult:
-        manifest = self.get_marketplace_manifest(marketplace)
-        entry = next((p for p in manifest.plugins if p.name == plugin_name), None)
+        entry = self._manifest_plugin_index(marketplace).get(plugin_name)
+        installed = self.is_installed(plugin_name, marketplace)
+        return self._check_update_entry(plugin_name, marketplace, entry, installed)
+
+    def _check_update_entry(
+        self,
+        plugin_name: str,
+        marketplace: str,
+        entry: PluginEntry | None,
+        installed: bool,
+    ) -> UpdateCheckResult:
+        """Build an update result from an already-resolved manifest entry.
+
+        Split out of check_update so bulk sweeps can reuse the cached
+        per-marketplace index and one list_installed pass instead of
+        re-resolving both per plugin.
+        """
         if entry is None:
             return UpdateCheckResult(
                 plugin_name=plugin_name,
@@ -296,31 +428,8 @@ class PluginManager:
                 has_update=False,
             )
         latest = entry.version
-        current: str | None = None
-        for ip in self.list_installed():
-            if ip.name == plugin_name and ip.marketplace == marketplace:
-                cache_path = self._state.get_cache_path(marketplace)
-                plugin_dir = cache_path
-                if (cache_path / "plugins" / plugin_name).exists():
-                    plugin_dir = cache_path / "plugins" / plugin_name
-                elif (cache_path / "external_plugins" / plugin_name).exists():
-                    plugin_dir = cache_path / "external_plugins" / plugin_name
-                manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-                if manifest_path.exists():
-                    import json
-
-                    data = json.loads(manifest_path.read_text(encoding="utf-8"))
-                    current = data.get("version")
-                break
-        if current is None or latest is None:
-            return UpdateCheckResult(
-                plugin_name=plugin_name,
-                marketplace=marketplace,
-                current_version=current,
-                latest_version=latest,
-                has_update=False,
-            )
-        has_update = latest != current
+        current = self._installed_version(plugin_name, marketplace) if installed else None
+        has_update = current is not None and latest is not None and latest != current
         return UpdateCheckResult(
             plugin_name=plugin_name,
             marketplace=marketplace,
@@ -329,14 +438,35 @@ class PluginManager:
             has_update=has_update,
         )
 
+    def _installed_version(self, plugin_name: str, marketplace: str) -> str | None:
+        cache_path = self._state.get_cache_path(marketplace)
+        base = str(cache_path)
+        plugin_dir = cache_path
+        # String joins + isdir keep this probe off pathlib's allocation-heavy
+        # arithmetic; each candidate is built exactly once.
+        for subdir in ("plugins", "external_plugins"):
+            candidate = os.path.join(base, subdir, plugin_name)
+            if os.path.isdir(candidate):
+                plugin_dir = Path(candidate)
+                break
+        manifest = _load_optional_manifest(plugin_dir)
+        return manifest.version if manifest is not None else None
+
     def check_all_updates(self) -> list[UpdateCheckResult]:
         results: list[UpdateCheckResult] = []
         seen: set[tuple[str, str]] = set()
-        for ip in self.list_installed():
-            if not ip.enabled:
-                continue
-            if (ip.name, ip.marketplace) in seen:
-                continue
-            seen.add((ip.name, ip.marketplace))
-            results.append(self.check_update(ip.name, ip.marketplace))
+        # Walk the cached per-scope maps directly; materializing
+        # InstalledPlugin objects just to filter and dedupe them is wasted
+        # allocation at this volume.
+        for sc in self._settings:
+            for key, enabled in self._get_enabled(sc).items():
+                if not enabled:
+                    continue
+                parsed = self._parse_key(key)
+                if parsed is None or parsed in seen:
+                    continue
+                seen.add(parsed)
+                name, mkt = parsed
+                entry = self._manifest_plugin_index(mkt).get(name)
+                results.append(self._check_update_entry(name, mkt, entry, installed=True))
         return results
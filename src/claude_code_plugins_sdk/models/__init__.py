@@ -1,6 +1,16 @@
+"""Pydantic models for plugin, marketplace, and state file formats.
+
+All models use ``extra="allow"`` deliberately: these formats are owned by
+Claude Code and grow fields over time, and the SDK re-serializes fetched
+manifests (HTTP marketplace caching) and state files (known marketplaces).
+Ignoring unknown fields would silently strip them on those round-trips, so
+the per-instance cost of carrying extras is accepted. The one exception is
+the blocklist models, which are read-only here and use ``extra="ignore"``.
+"""
+
 from .agent import AgentDefinition
 from .command import CommandDefinition
-from .hook import HookEntry, HookEvent, HookMatcher, HooksConfig
+from .hook import HookEntry, HookEvent, HookEventName, HookMatcher, HooksConfig
 from .lsp import LSPServerConfig, LSPServersConfig
 from .marketplace import (
     GitHubSource,
@@ -19,6 +29,7 @@ from .mcp import MCPServerConfig, MCPServersConfig
 from .plugin import Author, PluginManifest
 from .skill import SkillDefinition
 from .state import (
+    ANY_SOURCE_ADAPTER,
     AnyMarketplaceSource,
     BlocklistFile,
     BlocklistPlugin,
@@ -38,6 +49,7 @@ __all__ = [
     "HTTPSource",
     "HookEntry",
     "HookEvent",
+    "HookEventName",
     "HookMatcher",
     "HooksConfig",
     "LSPServerConfig",
@@ -55,6 +67,7 @@ __all__ = [
     "RelativePathSource",
     "SkillDefinition",
     "URLSource",
+    "ANY_SOURCE_ADAPTER",
     "AnyMarketplaceSource",
     "BlocklistFile",
     "BlocklistPlugin",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from enum import IntEnum
 from typing import Literal
 
 from pydantic import BaseModel, ConfigDict
@@ -42,6 +43,31 @@ HookEvent = Literal[
 ]
 
 
+class HookEventName(IntEnum):
+    """HookEvent values as an IntEnum for dispatch-side comparisons.
+
+    Member names match the JSON string values, so ``HookEventName[event]``
+    converts a parsed event name and repeated comparisons are identity-fast
+    integer checks instead of string equality. The ``HookEvent`` Literal
+    remains the wire format.
+    """
+
+    PreToolUse = 1
+    PostToolUse = 2
+    PostToolUseFailure = 3
+    SessionStart = 4
+    SessionEnd = 5
+    SubagentStart = 6
+    SubagentStop = 7
+    Stop = 8
+    Notification = 9
+    UserPromptSubmit = 10
+    PermissionRequest = 11
+    PreCompact = 12
+    TaskCompleted = 13
+    TeammateIdle = 14
+
+
 class HooksConfig(BaseModel):
     """Contents of hooks/hooks.json: event name -> list of matchers with hook entries."""
 
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Annotated, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class GitHubMarketplaceSource(BaseModel):
@@ -50,6 +51,12 @@ AnyMarketplaceSource = Annotated[
     Field(discriminator="source"),
 ]
 
+# Shared validator for the discriminated union. Building a TypeAdapter
+# compiles the discriminator schema, which is the expensive part of cold-path
+# source validation — callers loading sources in bulk should use this instead
+# of constructing their own adapter per call.
+ANY_SOURCE_ADAPTER = TypeAdapter(AnyMarketplaceSource)
+
 
 class KnownMarketplaceEntry(BaseModel):
     """Single entry in known_marketplaces.json."""
@@ -63,7 +70,10 @@ class KnownMarketplaceEntry(BaseModel):
 class BlocklistPlugin(BaseModel):
     """Single blocked plugin in blocklist.json."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    # The blocklist is read-only in this SDK (never re-serialized), so unknown
+    # fields can be dropped instead of carried in an extras dict per entry —
+    # the file can hold thousands of entries.
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
     plugin: str  # "name@marketplace"
     added_at: datetime
     reason: str | None = None
@@ -73,6 +83,15 @@ class BlocklistPlugin(BaseModel):
 class BlocklistFile(BaseModel):
     """Root of blocklist.json."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
     fetched_at: datetime = Field(alias="fetchedAt")
     plugins: list[BlocklistPlugin] = []
+
+    @cached_property
+    def blocked_keys(self) -> frozenset[str]:
+        """The "name@marketplace" keys of all blocked plugins.
+
+        Built on first access so "is this plugin blocked?" is a set probe
+        instead of a scan over the plugins list per query.
+        """
+        return frozenset(p.plugin for p in self.plugins)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+from .. import _json
 from ._marketplace import validate_marketplace as _validate_marketplace
 from ._plugin import validate_plugin as _validate_plugin
 from ._result import ValidationIssue, ValidationResult
@@ -26,13 +26,13 @@ def validate_plugin(data: dict[str, Any]) -> ValidationResult:
 
 def validate_marketplace_file(path: Path) -> ValidationResult:
     """Load and validate a marketplace.json file from disk."""
-    data = json.loads(path.read_text())
+    data = _json.loads(path.read_bytes())
     return _validate_marketplace(data)
 
 
 def validate_plugin_file(path: Path) -> ValidationResult:
     """Load and validate a plugin.json file from disk."""
-    data = json.loads(path.read_text())
+    data = _json.loads(path.read_bytes())
     return _validate_plugin(data)
 
 
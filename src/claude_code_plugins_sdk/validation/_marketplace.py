@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+from collections import Counter
 from typing import Any
 
 from ._result import ValidationIssue, ValidationResult
@@ -16,83 +18,100 @@ RESERVED_MARKETPLACE_NAMES = frozenset(
     }
 )
 
+# Lengths of the reserved names. Almost every validated name is not reserved,
+# and a length miss proves that without the .lower() allocation.
+_RESERVED_LENS = frozenset(map(len, RESERVED_MARKETPLACE_NAMES))
+
+# A ".." path component — delimited by either separator, since manifests
+# written on Windows may use backslashes — at the start, middle, or end of
+# the path. Compiled once; unlike a bare substring scan this doesn't flag
+# names that merely contain consecutive dots (e.g. "my..plugin").
+_PATH_TRAVERSAL_RE = re.compile(r"(^|[/\\])\.\.([/\\]|$)")
+
+# Source kinds the SDK cannot install yet. Membership here drives the
+# per-plugin warning, so supporting a new kind later is a one-line removal
+# rather than another elif arm.
+_UNIMPLEMENTED_SOURCES = frozenset({"npm", "pip"})
+
 
 def validate_marketplace(data: dict[str, Any]) -> ValidationResult:
     issues: list[ValidationIssue] = []
+    # Bound locals for the emission sites: LOAD_FAST instead of LOAD_GLOBAL
+    # plus a method lookup on every finding, per the hot-kernel convention in
+    # the agent runtime. Messages are only formatted inside the branches that
+    # actually produce an issue.
+    emit = issues.append
+    _issue = ValidationIssue
 
-    if "name" not in data or data["name"] is None:
-        issues.append(ValidationIssue("error", "name", "name: Required"))
-    elif (
-        isinstance(data.get("name"), str)
-        and data["name"].strip().lower() in RESERVED_MARKETPLACE_NAMES
-    ):
-        issues.append(
-            ValidationIssue("error", "name", f'Marketplace name "{data["name"]}" is reserved')
-        )
+    name = data.get("name")
+    if name is None:
+        emit(_issue("error", "name", "name: Required"))
+    elif isinstance(name, str):
+        # strip() returns the same object when there is nothing to strip, so
+        # the length gate usually rejects non-reserved names allocation-free.
+        stripped = name.strip()
+        if len(stripped) in _RESERVED_LENS and stripped.lower() in RESERVED_MARKETPLACE_NAMES:
+            emit(_issue("error", "name", f'Marketplace name "{name}" is reserved'))
 
-    if "owner" not in data or data["owner"] is None:
-        issues.append(ValidationIssue("error", "owner", "owner: Required"))
+    if data.get("owner") is None:
+        emit(_issue("error", "owner", "owner: Required"))
 
     plugins = data.get("plugins")
     if plugins is None:
-        issues.append(ValidationIssue("error", "plugins", "plugins: Required"))
+        emit(_issue("error", "plugins", "plugins: Required"))
     else:
         if isinstance(plugins, list) and len(plugins) == 0:
-            issues.append(
-                ValidationIssue("warning", "plugins", "Marketplace has no plugins defined")
-            )
+            emit(_issue("warning", "plugins", "Marketplace has no plugins defined"))
         elif isinstance(plugins, list):
-            seen_names: set[str] = set()
-            for i, entry in enumerate(plugins):
-                if not isinstance(entry, dict):
-                    continue
-                name = entry.get("name")
-                if isinstance(name, str):
-                    if name in seen_names:
-                        issues.append(
-                            ValidationIssue(
-                                "error",
-                                f"plugins[{i}].name",
-                                f'Duplicate plugin name "{name}" found in marketplace',
-                            )
+            # Classify entries once: a single comprehension filters out
+            # non-dict shapes and pulls name/source, so the checks below run
+            # as flat loops without re-dispatching isinstance per field.
+            entries = [
+                (i, e.get("name"), e.get("source"))
+                for i, e in enumerate(plugins)
+                if isinstance(e, dict)
+            ]
+
+            # Count names in one C-level pass and report each duplicate once,
+            # instead of tracking a seen-set and emitting per occurrence.
+            name_counts = Counter(name for _, name, _ in entries if type(name) is str)
+            for name, count in name_counts.items():
+                if count > 1:
+                    emit(
+                        _issue(
+                            "error",
+                            "plugins[].name",
+                            f'Duplicate plugin name "{name}" found in marketplace',
                         )
-                    seen_names.add(name)
+                    )
 
-                src = entry.get("source")
-                path_prefix = f"plugins[{i}].source"
-                if isinstance(src, str):
-                    if ".." in src:
-                        issues.append(
-                            ValidationIssue(
+            for i, name, src in entries:
+                if type(src) is str:
+                    if _PATH_TRAVERSAL_RE.search(src):
+                        emit(
+                            _issue(
                                 "error",
-                                path_prefix,
+                                f"plugins[{i}].source",
                                 "plugins[N].source: Path traversal not allowed",
                             )
                         )
-                elif isinstance(src, dict):
+                elif type(src) is dict:
                     src_type = src.get("source")
-                    plugin_name = entry.get("name") or f"plugins[{i}]"
-                    if src_type == "npm":
-                        issues.append(
-                            ValidationIssue(
-                                "warning",
-                                path_prefix,
-                                f'Plugin "{plugin_name}" uses npm source which is not yet fully implemented',
-                            )
-                        )
-                    elif src_type == "pip":
-                        issues.append(
-                            ValidationIssue(
+                    if src_type in _UNIMPLEMENTED_SOURCES:
+                        plugin_name = name or f"plugins[{i}]"
+                        emit(
+                            _issue(
                                 "warning",
-                                path_prefix,
-                                f'Plugin "{plugin_name}" uses pip source which is not yet fully implemented',
+                                f"plugins[{i}].source",
+                                f'Plugin "{plugin_name}" uses {src_type} source'
+                                " which is not yet fully implemented",
                             )
                         )
 
     metadata = data.get("metadata")
     if not metadata or not isinstance(metadata, dict):
-        issues.append(
-            ValidationIssue(
+        emit(
+            _issue(
                 "warning",
                 "metadata.description",
                 "No marketplace description provided.",
@@ -101,8 +120,8 @@ def validate_marketplace(data: dict[str, Any]) -> ValidationResult:
     else:
         desc = metadata.get("description")
         if desc is None or (isinstance(desc, str) and not desc.strip()):
-            issues.append(
-                ValidationIssue(
+            emit(
+                _issue(
                     "warning",
                     "metadata.description",
                     "No marketplace description provided.",
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Literal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationIssue:
     """A single validation finding (error or warning)."""
 
@@ -12,8 +13,15 @@ class ValidationIssue:
     path: str  # JSON path or field name where the issue was found
     message: str
 
+    # level is one of two values and path repeats heavily across issues;
+    # interning both dedupes the strings in large result sets and lets
+    # equality checks short-circuit on identity.
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "level", sys.intern(self.level))
+        object.__setattr__(self, "path", sys.intern(self.path))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of validating a plugin or marketplace manifest.
 
@@ -23,15 +31,23 @@ class ValidationResult:
     """
 
     issues: list[ValidationIssue]
+    _errors: list[ValidationIssue] = field(init=False, repr=False, compare=False)
+    _warnings: list[ValidationIssue] = field(init=False, repr=False, compare=False)
+
+    # Issues are fixed at construction, so partition them once here rather
+    # than re-scanning the list on every .errors/.warnings/.valid access.
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_errors", [i for i in self.issues if i.level == "error"])
+        object.__setattr__(self, "_warnings", [i for i in self.issues if i.level == "warning"])
 
     @property
     def valid(self) -> bool:
-        return not any(i.level == "error" for i in self.issues)
+        return not self._errors
 
     @property
     def warnings(self) -> list[ValidationIssue]:
-        return [i for i in self.issues if i.level == "warning"]
+        return self._warnings
 
     @property
     def errors(self) -> list[ValidationIssue]:
-        return [i for i in self.issues if i.level == "error"]
+        return self._errors
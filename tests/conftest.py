@@ -0,0 +1,84 @@
+"""Shared pytest configuration and fixtures."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from claude_code_plugins_sdk import _json
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def pytest_configure(config):
+    # Keep tmp_path fixtures on tmpfs where one exists: the suite does many
+    # small writes (git fixture repos, settings round-trips) that stall on
+    # slow or networked CI disks. An explicit --basetemp still wins, and
+    # xdist workers inherit their basetemp from the controller untouched.
+    # The path carries the uid and pid because pytest deletes an explicit
+    # basetemp at session start — a shared name would let concurrent runs
+    # (or another user's leftover directory) wipe or block each other.
+    if (
+        sys.platform == "linux"
+        and config.option.basetemp is None
+        and "PYTEST_XDIST_WORKER" not in os.environ
+        and Path("/dev/shm").is_dir()
+    ):
+        config.option.basetemp = f"/dev/shm/pytest-ccp-sdk-{os.getuid()}-{os.getpid()}"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_git_cache(tmp_path, monkeypatch):
+    """Keep the persistent git fetch cache out of the developer's home.
+
+    The git fetcher resolves its cache root from XDG_CACHE_HOME once and
+    latches it in a module global, so the env override alone would only
+    help until the first fetch; resetting the global makes every test
+    resolve into its own tmp dir. monkeypatch restores both on teardown.
+    """
+    from claude_code_plugins_sdk.fetchers import _git
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+    monkeypatch.setattr(_git, "_cache", None)
+
+
+def _read_fixture(*parts: str) -> bytes:
+    return FIXTURES.joinpath(*parts).read_bytes()
+
+
+# Read once per session. The JSON fixtures are served as raw bytes so tests
+# can feed them straight to model_validate_json, which parses and validates
+# in one pass in pydantic-core with no intermediate dict. lsp_fixture is the
+# exception: its test indexes into a subtree first, so it gets the parsed
+# dict (via the SDK's codec shim — orjson when the json extra is installed).
+
+
+@pytest.fixture(scope="session")
+def marketplace_full_fixture():
+    return _read_fixture("marketplace", ".claude-plugin", "marketplace.json")
+
+
+@pytest.fixture(scope="session")
+def marketplace_minimal_fixture():
+    return _read_fixture("marketplace", ".claude-plugin", "minimal-marketplace.json")
+
+
+@pytest.fixture(scope="session")
+def plugin_manifest_fixture():
+    return _read_fixture("plugin", ".claude-plugin", "plugin.json")
+
+
+@pytest.fixture(scope="session")
+def hooks_fixture():
+    return _read_fixture("plugin", "hooks", "hooks.json")
+
+
+@pytest.fixture(scope="session")
+def mcp_fixture():
+    return _read_fixture("plugin", ".mcp.json")
+
+
+@pytest.fixture(scope="session")
+def lsp_fixture():
+    return _json.loads(_read_fixture("plugin", ".lsp.json"))
@@ -1,9 +1,12 @@
 """Tests for AgentRuntime — list, get, and search skills."""
 
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
+from claude_code_plugins_sdk import PluginManager
 from claude_code_plugins_sdk.agent import (
     AgentMatch,
     AgentRuntime,
@@ -13,6 +16,11 @@ from claude_code_plugins_sdk.agent import (
     SkillMatch,
     SkillSummary,
 )
+from claude_code_plugins_sdk.manager._in_memory import (
+    InMemoryMarketplaceAdapter,
+    InMemorySettingsAdapter,
+)
+from claude_code_plugins_sdk.models.state import GitHubMarketplaceSource, KnownMarketplaceEntry
 
 PLUGIN_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "plugin"
 
@@ -116,6 +124,50 @@ def test_search_skills_limit(tmp_path: Path):
     assert len(results) <= 3
 
 
+def test_search_skills_prefix_match(tmp_path: Path):
+    skills_dir = tmp_path / "skills"
+    d = skills_dir / "skill-a"
+    d.mkdir(parents=True)
+    (d / "SKILL.md").write_text(
+        "---\nname: review\ndescription: helps with stuff\n---\nBody.\n",
+        encoding="utf-8",
+    )
+
+    runtime = AgentRuntime.from_plugins([("p", tmp_path)])
+    # A partially typed query should still surface the skill, below an
+    # exact match's score.
+    results = runtime.search_skills("rev")
+    assert len(results) == 1
+    assert results[0].skill.slug == "skill-a"
+    assert 0.0 < results[0].score < runtime.search_skills("review")[0].score
+
+
+def test_search_skills_exact_match_beats_prefix_matches(tmp_path: Path):
+    skills_dir = tmp_path / "skills"
+
+    # skill-a: three name tokens that all merely share the prefix "co"
+    a = skills_dir / "skill-a"
+    a.mkdir(parents=True)
+    (a / "SKILL.md").write_text(
+        "---\nname: code config core\ndescription: prefix bait\n---\nBody.\n",
+        encoding="utf-8",
+    )
+
+    # skill-b: exact token "co" in the name
+    b = skills_dir / "skill-b"
+    b.mkdir(parents=True)
+    (b / "SKILL.md").write_text(
+        "---\nname: co\ndescription: exact match\n---\nBody.\n",
+        encoding="utf-8",
+    )
+
+    runtime = AgentRuntime.from_plugins([("p", tmp_path)])
+    results = runtime.search_skills("co")
+    assert [r.skill.slug for r in results] == ["skill-b", "skill-a"]
+    # Stacked prefix expansions must not tie the exact match.
+    assert results[0].score > results[1].score
+
+
 def test_search_skills_score_name_higher_than_description(tmp_path: Path):
     skills_dir = tmp_path / "skills"
 
@@ -148,14 +200,6 @@ def test_search_skills_score_name_higher_than_description(tmp_path: Path):
 
 def test_from_manager_only_enabled_plugins():
     """from_manager skips disabled plugins."""
-    from contextlib import contextmanager
-
-    from claude_code_plugins_sdk import PluginManager
-    from claude_code_plugins_sdk.manager._in_memory import (
-        InMemoryMarketplaceAdapter,
-        InMemorySettingsAdapter,
-    )
-    from claude_code_plugins_sdk.models.state import GitHubMarketplaceSource, KnownMarketplaceEntry
 
     @contextmanager
     def _noop_fetch(source):
@@ -165,8 +209,6 @@ def test_from_manager_only_enabled_plugins():
         def fetch(self, source):
             return _noop_fetch(source)
 
-    from datetime import datetime, timezone
-
     entry = KnownMarketplaceEntry(
         source=GitHubMarketplaceSource(source="github", repo="owner/repo"),
         installLocation=PLUGIN_FIXTURE,
@@ -283,16 +325,6 @@ def test_search_agents_empty_query_returns_all():
 
 
 def test_from_manager_loads_commands_and_agents():
-    from contextlib import contextmanager
-    from datetime import datetime, timezone
-
-    from claude_code_plugins_sdk import PluginManager
-    from claude_code_plugins_sdk.manager._in_memory import (
-        InMemoryMarketplaceAdapter,
-        InMemorySettingsAdapter,
-    )
-    from claude_code_plugins_sdk.models.state import GitHubMarketplaceSource, KnownMarketplaceEntry
-
     @contextmanager
     def _noop_fetch(source):
         yield PLUGIN_FIXTURE
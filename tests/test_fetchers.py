@@ -1,9 +1,11 @@
 """Tests for the remote fetcher layer."""
 
 import json
+import os
 import subprocess
 from pathlib import Path
 
+import httpx
 import pytest
 from pydantic import ValidationError
 
@@ -25,6 +27,18 @@ VALID_MARKETPLACE = {
 }
 
 
+# Output from the fixture git calls is never inspected; DEVNULL skips the
+# pipe allocation and drain that capture_output pays per call. The env
+# overrides stop git walking template dirs and system config on every
+# invocation — fixture repos need neither.
+_GIT_QUIET: dict = {
+    "stdout": subprocess.DEVNULL,
+    "stderr": subprocess.DEVNULL,
+    "check": True,
+    "env": {**os.environ, "GIT_TEMPLATE_DIR": "", "GIT_CONFIG_NOSYSTEM": "1"},
+}
+
+
 def make_git_marketplace(tmp_path: Path, data: dict) -> Path:
     """Create a local git repo with a marketplace.json."""
     repo = tmp_path / "repo"
@@ -32,31 +46,74 @@ def make_git_marketplace(tmp_path: Path, data: dict) -> Path:
     claude_plugin = repo / ".claude-plugin"
     claude_plugin.mkdir()
     (claude_plugin / "marketplace.json").write_text(json.dumps(data))
-    subprocess.run(["git", "init", str(repo)], capture_output=True, check=True)
-    subprocess.run(
-        ["git", "-C", str(repo), "config", "user.email", "t@t.com"],
-        capture_output=True,
-        check=True,
-    )
+    subprocess.run(["git", "init", "-q", "--initial-branch=main", str(repo)], **_GIT_QUIET)
+    subprocess.run(["git", "-C", str(repo), "add", "."], **_GIT_QUIET)
+    # Identity is passed as one-shot -c overrides so no separate config
+    # subprocesses are forked per repo.
     subprocess.run(
-        ["git", "-C", str(repo), "config", "user.name", "T"],
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(["git", "-C", str(repo), "add", "."], capture_output=True, check=True)
-    subprocess.run(
-        ["git", "-C", str(repo), "commit", "-m", "init"],
-        capture_output=True,
-        check=True,
+        [
+            "git",
+            "-C",
+            str(repo),
+            "-c",
+            "user.email=t@t.com",
+            "-c",
+            "user.name=T",
+            "commit",
+            "-m",
+            "init",
+        ],
+        **_GIT_QUIET,
     )
     return repo
 
 
+class _ResponseQueue:
+    """Queue of canned responses served by an in-memory httpx transport."""
+
+    def __init__(self) -> None:
+        self._queue: list[httpx.Response] = []
+
+    def add_response(self, status_code: int = 200, json=None, content: bytes = b"") -> None:
+        self._queue.append(httpx.Response(status_code, json=json, content=content or None))
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        return self._queue.pop(0)
+
+
+@pytest.fixture
+def http_responses(monkeypatch):
+    """Route the fetcher's pooled client through httpx.MockTransport.
+
+    Talking to the transport directly skips the interception bookkeeping a
+    mocking plugin layers onto every request, and leaves the real pooled
+    client untouched for other tests.
+    """
+    from claude_code_plugins_sdk.fetchers import _http
+
+    responses = _ResponseQueue()
+    client = httpx.Client(transport=httpx.MockTransport(responses), follow_redirects=True)
+    monkeypatch.setattr(_http, "_client", client)
+    yield responses
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def git_marketplace_url(tmp_path_factory) -> str:
+    """file:// URL of a valid marketplace repo, built once per session.
+
+    Repo construction forks git several times; tests that only read the
+    repo share one build instead of paying that per test.
+    """
+    repo = make_git_marketplace(tmp_path_factory.mktemp("marketplace-repo"), VALID_MARKETPLACE)
+    return f"file://{repo.resolve()}"
+
+
 # --- HTTP fetcher tests ---
 
 
-def test_fetch_via_http_success(httpx_mock):
-    httpx_mock.add_response(json=VALID_MARKETPLACE)
+def test_fetch_via_http_success(http_responses):
+    http_responses.add_response(json=VALID_MARKETPLACE)
     result = fetch_marketplace(
         HTTPSource(source="http", url="https://example.com/marketplace.json")
     )
@@ -65,26 +122,26 @@ def test_fetch_via_http_success(httpx_mock):
     assert result.plugins[0].name == "plugin-a"
 
 
-def test_fetch_via_http_404(httpx_mock):
-    httpx_mock.add_response(status_code=404)
+def test_fetch_via_http_404(http_responses):
+    http_responses.add_response(status_code=404)
     with pytest.raises(FetchError):
         fetch_marketplace(HTTPSource(source="http", url="https://example.com/marketplace.json"))
 
 
-def test_fetch_via_http_500(httpx_mock):
-    httpx_mock.add_response(status_code=500)
+def test_fetch_via_http_500(http_responses):
+    http_responses.add_response(status_code=500)
     with pytest.raises(FetchError):
         fetch_marketplace(HTTPSource(source="http", url="https://example.com/marketplace.json"))
 
 
-def test_fetch_via_http_invalid_json(httpx_mock):
-    httpx_mock.add_response(content=b"not json", status_code=200)
+def test_fetch_via_http_invalid_json(http_responses):
+    http_responses.add_response(content=b"not json", status_code=200)
     with pytest.raises(FetchError):
         fetch_marketplace(HTTPSource(source="http", url="https://example.com/marketplace.json"))
 
 
-def test_fetch_via_http_invalid_schema(httpx_mock):
-    httpx_mock.add_response(json={"plugins": []}, status_code=200)
+def test_fetch_via_http_invalid_schema(http_responses):
+    http_responses.add_response(json={"plugins": []}, status_code=200)
     with pytest.raises(ValidationError):
         fetch_marketplace(HTTPSource(source="http", url="https://example.com/marketplace.json"))
 
@@ -92,10 +149,8 @@ def test_fetch_via_http_invalid_schema(httpx_mock):
 # --- Git fetcher tests ---
 
 
-def test_fetch_via_git_local(tmp_path):
-    repo = make_git_marketplace(tmp_path, VALID_MARKETPLACE)
-    url = f"file://{repo.resolve()}"
-    result = fetch_marketplace(URLSource(source="url", url=url))
+def test_fetch_via_git_local(git_marketplace_url):
+    result = fetch_marketplace(URLSource(source="url", url=git_marketplace_url))
     assert result.name == "test-marketplace"
     assert len(result.plugins) == 1
 
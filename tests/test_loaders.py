@@ -13,7 +13,7 @@ from claude_code_plugins_sdk import (
 )
 from claude_code_plugins_sdk.models.marketplace import GitHubSource
 
-FIXTURE_ROOT = Path("tests/fixtures")
+FIXTURE_ROOT = Path(__file__).resolve().parent / "fixtures"
 
 
 # --- load_marketplace ---
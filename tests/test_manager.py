@@ -1,6 +1,5 @@
 """Tests for PluginManager and adapters."""
 
-from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -27,16 +26,42 @@ from claude_code_plugins_sdk.models.state import (
 FIXTURES = Path(__file__).resolve().parent / "fixtures" / "marketplace"
 
 
-@contextmanager
-def _yield_fixture_path():
-    yield FIXTURES
+def _blocklist(*keys: str) -> BlocklistFile:
+    """Build a blocklist from trusted literal keys.
+
+    model_construct skips pydantic validation, which these fixture objects
+    don't need — the values are compile-time constants.
+    """
+    ts = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return BlocklistFile.model_construct(
+        fetched_at=ts,
+        plugins=[BlocklistPlugin.model_construct(plugin=key, added_at=ts) for key in keys],
+    )
+
+
+class _FixtureCM:
+    """Reusable context manager yielding the fixture marketplace path.
+
+    A plain class instead of @contextmanager: fetch is called for every
+    marketplace and plugin operation, and the singleton below avoids
+    allocating a generator frame per call.
+    """
+
+    def __enter__(self):
+        return FIXTURES
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_FIXTURE_CM = _FixtureCM()
 
 
 class MockFetchAdapter:
     """Yields the fixture marketplace path for any source."""
 
     def fetch(self, source):
-        return _yield_fixture_path()
+        return _FIXTURE_CM
 
 
 class CountingFetchAdapter:
@@ -47,7 +72,7 @@ class CountingFetchAdapter:
 
     def fetch(self, source):
         self.call_count += 1
-        return _yield_fixture_path()
+        return _FIXTURE_CM
 
 
 def _make_manager(
@@ -63,6 +88,25 @@ def _make_manager(
     )
 
 
+@pytest.fixture
+def manager_with_marketplace():
+    """Manager with the fixture marketplace added.
+
+    Function-scoped on purpose: most tests mutate the manager, so the
+    fixture shares setup code rather than state.
+    """
+    manager = _make_manager()
+    manager.add_marketplace("owner/repo")
+    return manager
+
+
+@pytest.fixture
+def installed_manager(manager_with_marketplace):
+    """manager_with_marketplace with local-plugin installed in user scope."""
+    manager_with_marketplace.install("local-plugin", "example-marketplace")
+    return manager_with_marketplace
+
+
 def test_add_marketplace_appears_in_list():
     manager = _make_manager()
     entry = manager.add_marketplace("owner/repo")
@@ -72,11 +116,9 @@ def test_add_marketplace_appears_in_list():
     assert listed["example-marketplace"].source.repo == "owner/repo"
 
 
-def test_remove_marketplace():
-    manager = _make_manager()
-    manager.add_marketplace("owner/repo")
-    manager.remove_marketplace("example-marketplace")
-    assert manager.list_marketplaces() == {}
+def test_remove_marketplace(manager_with_marketplace):
+    manager_with_marketplace.remove_marketplace("example-marketplace")
+    assert manager_with_marketplace.list_marketplaces() == {}
 
 
 def test_remove_marketplace_unknown_raises():
@@ -85,10 +127,8 @@ def test_remove_marketplace_unknown_raises():
         manager.remove_marketplace("no-such")
 
 
-def test_get_marketplace_manifest():
-    manager = _make_manager()
-    manager.add_marketplace("owner/repo")
-    manifest = manager.get_marketplace_manifest("example-marketplace")
+def test_get_marketplace_manifest(manager_with_marketplace):
+    manifest = manager_with_marketplace.get_marketplace_manifest("example-marketplace")
     assert manifest.name == "example-marketplace"
     assert len(manifest.plugins) >= 1
     names = [p.name for p in manifest.plugins]
@@ -101,11 +141,8 @@ def test_get_marketplace_manifest_unknown_raises():
         manager.get_marketplace_manifest("no-such")
 
 
-def test_install_adds_to_enabled_plugins():
-    manager = _make_manager()
-    manager.add_marketplace("owner/repo")
-    manager.install("local-plugin", "example-marketplace")
-    installed = manager.list_installed()
+def test_install_adds_to_enabled_plugins(installed_manager):
+    installed = installed_manager.list_installed()
     assert len(installed) == 1
     assert installed[0].name == "local-plugin"
     assert installed[0].marketplace == "example-marketplace"
@@ -113,12 +150,7 @@ def test_install_adds_to_enabled_plugins():
 
 
 def test_install_blocked_plugin_raises():
-    ts = datetime(1970, 1, 1, tzinfo=timezone.utc)
-    blocklist = BlocklistFile(
-        fetchedAt=ts,
-        plugins=[BlocklistPlugin(plugin="local-plugin@example-marketplace", added_at=ts)],
-    )
-    manager = _make_manager(blocklist=blocklist)
+    manager = _make_manager(blocklist=_blocklist("local-plugin@example-marketplace"))
     manager.add_marketplace("owner/repo")
     with pytest.raises(PluginBlockedError, match="local-plugin@example-marketplace"):
         manager.install("local-plugin", "example-marketplace")
@@ -130,25 +162,18 @@ def test_install_unknown_marketplace_raises():
         manager.install("local-plugin", "no-such")
 
 
-def test_install_unknown_plugin_raises():
-    manager = _make_manager()
-    manager.add_marketplace("owner/repo")
+def test_install_unknown_plugin_raises(manager_with_marketplace):
     with pytest.raises(PluginNotFoundError, match="nonexistent-plugin.*example-marketplace"):
-        manager.install("nonexistent-plugin", "example-marketplace")
+        manager_with_marketplace.install("nonexistent-plugin", "example-marketplace")
 
 
-def test_install_already_installed_raises():
-    manager = _make_manager()
-    manager.add_marketplace("owner/repo")
-    manager.install("local-plugin", "example-marketplace")
+def test_install_already_installed_raises(installed_manager):
     with pytest.raises(AlreadyInstalledError, match="local-plugin@example-marketplace"):
-        manager.install("local-plugin", "example-marketplace")
+        installed_manager.install("local-plugin", "example-marketplace")
 
 
-def test_disable_and_enable():
-    manager = _make_manager()
-    manager.add_marketplace("owner/repo")
-    manager.install("local-plugin", "example-marketplace")
+def test_disable_and_enable(installed_manager):
+    manager = installed_manager
     manager.disable("local-plugin", "example-marketplace")
     installed = manager.list_installed()
     assert installed[0].enabled is False
@@ -157,24 +182,18 @@ def test_disable_and_enable():
     assert installed[0].enabled is True
 
 
-def test_uninstall_removes_from_list():
-    manager = _make_manager()
-    manager.add_marketplace("owner/repo")
-    manager.install("local-plugin", "example-marketplace")
-    manager.uninstall("local-plugin", "example-marketplace")
-    assert manager.list_installed() == []
+def test_uninstall_removes_from_list(installed_manager):
+    installed_manager.uninstall("local-plugin", "example-marketplace")
+    assert installed_manager.list_installed() == []
 
 
-def test_uninstall_not_installed_raises():
-    manager = _make_manager()
-    manager.add_marketplace("owner/repo")
+def test_uninstall_not_installed_raises(manager_with_marketplace):
     with pytest.raises(NotInstalledError, match="local-plugin@example-marketplace"):
-        manager.uninstall("local-plugin", "example-marketplace")
+        manager_with_marketplace.uninstall("local-plugin", "example-marketplace")
 
 
-def test_is_installed_and_is_enabled():
-    manager = _make_manager()
-    manager.add_marketplace("owner/repo")
+def test_is_installed_and_is_enabled(manager_with_marketplace):
+    manager = manager_with_marketplace
     assert manager.is_installed("local-plugin", "example-marketplace") is False
     manager.install("local-plugin", "example-marketplace")
     assert manager.is_installed("local-plugin", "example-marketplace") is True
@@ -185,32 +204,21 @@ def test_is_installed_and_is_enabled():
 
 
 def test_is_blocked():
-    from datetime import datetime, timezone
-
-    blocklist = BlocklistFile(
-        fetchedAt=datetime(1970, 1, 1, tzinfo=timezone.utc),
-        plugins=[BlocklistPlugin(plugin="a@b", added_at=datetime(1970, 1, 1, tzinfo=timezone.utc))],
-    )
-    manager = _make_manager(blocklist=blocklist)
+    manager = _make_manager(blocklist=_blocklist("a@b"))
     assert manager.is_blocked("a", "b") is True
     assert manager.is_blocked("a", "c") is False
 
 
-def test_check_update_no_version_has_update_false():
-    manager = _make_manager()
-    manager.add_marketplace("owner/repo")
-    manager.install("local-plugin", "example-marketplace")
-    result = manager.check_update("local-plugin", "example-marketplace")
+def test_check_update_no_version_has_update_false(installed_manager):
+    result = installed_manager.check_update("local-plugin", "example-marketplace")
     assert result.plugin_name == "local-plugin"
     assert result.marketplace == "example-marketplace"
     assert result.has_update is False
 
 
-def test_scope_not_configured_raises():
-    manager = _make_manager()
-    manager.add_marketplace("owner/repo")
+def test_scope_not_configured_raises(manager_with_marketplace):
     with pytest.raises(ValueError, match="project"):
-        manager.install("local-plugin", "example-marketplace", scope="project")
+        manager_with_marketplace.install("local-plugin", "example-marketplace", scope="project")
 
 
 # --- plugin-cache tests ---
@@ -250,26 +258,21 @@ def test_install_relative_source_no_fetch():
     assert not cache_path.is_dir()
 
 
-def test_install_npm_source_raises_fetch_error():
+def test_install_npm_source_raises_fetch_error(manager_with_marketplace):
     """Installing a plugin with NPMSource must raise FetchError."""
-    manager = _make_manager()
-    manager.add_marketplace("owner/repo")
     with pytest.raises(FetchError, match="NPMSource"):
-        manager.install("npm-plugin", "example-marketplace")
+        manager_with_marketplace.install("npm-plugin", "example-marketplace")
 
 
-def test_install_pip_source_raises_fetch_error():
+def test_install_pip_source_raises_fetch_error(manager_with_marketplace):
     """Installing a plugin with PIPSource must raise FetchError."""
-    manager = _make_manager()
-    manager.add_marketplace("owner/repo")
     with pytest.raises(FetchError, match="PIPSource"):
-        manager.install("pip-plugin", "example-marketplace")
+        manager_with_marketplace.install("pip-plugin", "example-marketplace")
 
 
-def test_uninstall_clears_plugin_cache():
+def test_uninstall_clears_plugin_cache(manager_with_marketplace):
     """Uninstalling an external plugin should remove its plugin cache."""
-    manager = _make_manager()
-    manager.add_marketplace("owner/repo")
+    manager = manager_with_marketplace
     manager.install("github-plugin", "example-marketplace")
 
     cache_path = manager._state.get_plugin_cache_path("example-marketplace", "github-plugin")
@@ -3,6 +3,8 @@
 import json
 from datetime import datetime, timezone
 
+import pytest
+
 from claude_code_plugins_sdk.manager._adapters import (
     LocalFilesystemMarketplaceAdapter,
     LocalFilesystemSettingsAdapter,
@@ -13,8 +15,23 @@ from claude_code_plugins_sdk.models.state import (
 )
 
 
-def test_marketplace_adapter_round_trip(tmp_path):
-    adapter = LocalFilesystemMarketplaceAdapter(tmp_path)
+@pytest.fixture
+def mkt_adapter(tmp_path):
+    return LocalFilesystemMarketplaceAdapter(tmp_path)
+
+
+@pytest.fixture
+def settings_path(tmp_path):
+    return tmp_path / "settings.json"
+
+
+@pytest.fixture
+def settings_adapter(settings_path):
+    return LocalFilesystemSettingsAdapter(settings_path)
+
+
+def test_marketplace_adapter_round_trip(mkt_adapter, tmp_path):
+    adapter = mkt_adapter
     assert adapter.get_marketplaces() == {}
 
     entry = KnownMarketplaceEntry(
@@ -29,24 +46,21 @@ def test_marketplace_adapter_round_trip(tmp_path):
     assert isinstance(src, GitHubMarketplaceSource) and src.repo == "owner/repo"
 
 
-def test_marketplace_adapter_missing_file_returns_empty(tmp_path):
-    adapter = LocalFilesystemMarketplaceAdapter(tmp_path)
-    assert adapter.get_marketplaces() == {}
+def test_marketplace_adapter_missing_file_returns_empty(mkt_adapter):
+    assert mkt_adapter.get_marketplaces() == {}
 
 
-def test_settings_adapter_round_trip(tmp_path):
-    settings_path = tmp_path / "settings.json"
-    adapter = LocalFilesystemSettingsAdapter(settings_path)
+def test_settings_adapter_round_trip(settings_adapter):
+    adapter = settings_adapter
     assert adapter.get_enabled_plugins() == {}
 
     adapter.set_enabled_plugins({"a@b": True, "c@d": False})
     assert adapter.get_enabled_plugins() == {"a@b": True, "c@d": False}
 
 
-def test_settings_adapter_merge_preserves_other_keys(tmp_path):
-    settings_path = tmp_path / "settings.json"
+def test_settings_adapter_merge_preserves_other_keys(settings_adapter, settings_path):
     settings_path.write_text(json.dumps({"model": "opus", "enabledPlugins": {"old@m": True}}))
-    adapter = LocalFilesystemSettingsAdapter(settings_path)
+    adapter = settings_adapter
     plugins = adapter.get_enabled_plugins()
     plugins["new@m"] = True
     adapter.set_enabled_plugins(plugins)
@@ -65,46 +79,50 @@ def test_settings_adapter_missing_file_returns_empty(tmp_path):
 # --- plugin cache tests ---
 
 
-def test_store_and_get_plugin_cache(tmp_path):
-    adapter = LocalFilesystemMarketplaceAdapter(tmp_path)
-
-    source = tmp_path / "source-plugin"
+@pytest.fixture(scope="class")
+def cache_ctx(tmp_path_factory):
+    """One shared adapter plus a prebuilt source tree for the cache tests."""
+    base = tmp_path_factory.mktemp("plugin-cache")
+    source = base / "source-plugin"
     source.mkdir()
     (source / "HELLO.txt").write_text("hi")
-
-    result = adapter.store_plugin_cache("my-marketplace", "my-plugin", source)
-    assert result.is_dir()
-    assert (result / "HELLO.txt").read_text() == "hi"
-
-    fetched = adapter.get_plugin_cache_path("my-marketplace", "my-plugin")
-    assert fetched == result
-    assert (fetched / "HELLO.txt").read_text() == "hi"
-
-
-def test_delete_plugin_cache(tmp_path):
-    adapter = LocalFilesystemMarketplaceAdapter(tmp_path)
-
-    source = tmp_path / "source-plugin"
-    source.mkdir()
-    (source / "file.txt").write_text("data")
-
-    adapter.store_plugin_cache("mkt", "plugin", source)
-    cache_path = adapter.get_plugin_cache_path("mkt", "plugin")
-    assert cache_path.is_dir()
-
-    adapter.delete_plugin_cache("mkt", "plugin")
-    assert not cache_path.exists()
-
-
-def test_delete_plugin_cache_noop_if_missing(tmp_path):
-    adapter = LocalFilesystemMarketplaceAdapter(tmp_path)
-    # Should not raise even if nothing was ever stored
-    adapter.delete_plugin_cache("mkt", "no-such-plugin")
-
-
-def test_get_plugin_cache_path_not_yet_fetched(tmp_path):
-    adapter = LocalFilesystemMarketplaceAdapter(tmp_path)
-    path = adapter.get_plugin_cache_path("mkt", "plugin")
-    # Returns a path — no exception — but it doesn't exist yet
-    assert not path.exists()
-    assert path.name == "plugin"
+    return LocalFilesystemMarketplaceAdapter(base), source
+
+
+class TestPluginCache:
+    """Plugin-cache round trips against one shared adapter.
+
+    The adapter and source tree are built once for the class; each test
+    works on its own plugin name, so the tests stay order-independent.
+    """
+
+    def test_store_and_get_plugin_cache(self, cache_ctx):
+        adapter, source = cache_ctx
+        result = adapter.store_plugin_cache("my-marketplace", "my-plugin", source)
+        assert result.is_dir()
+        assert (result / "HELLO.txt").read_text() == "hi"
+
+        fetched = adapter.get_plugin_cache_path("my-marketplace", "my-plugin")
+        assert fetched == result
+        assert (fetched / "HELLO.txt").read_text() == "hi"
+
+    def test_delete_plugin_cache(self, cache_ctx):
+        adapter, source = cache_ctx
+        adapter.store_plugin_cache("mkt", "plugin", source)
+        cache_path = adapter.get_plugin_cache_path("mkt", "plugin")
+        assert cache_path.is_dir()
+
+        adapter.delete_plugin_cache("mkt", "plugin")
+        assert not cache_path.exists()
+
+    def test_delete_plugin_cache_noop_if_missing(self, cache_ctx):
+        adapter, _ = cache_ctx
+        # Should not raise even if nothing was ever stored
+        adapter.delete_plugin_cache("mkt", "no-such-plugin")
+
+    def test_get_plugin_cache_path_not_yet_fetched(self, cache_ctx):
+        adapter, _ = cache_ctx
+        path = adapter.get_plugin_cache_path("mkt", "never-fetched")
+        # Returns a path — no exception — but it doesn't exist yet
+        assert not path.exists()
+        assert path.name == "never-fetched"
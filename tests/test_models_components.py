@@ -1,6 +1,3 @@
-import json
-from pathlib import Path
-
 from claude_code_plugins_sdk.models.agent import AgentDefinition
 from claude_code_plugins_sdk.models.command import CommandDefinition
 from claude_code_plugins_sdk.models.hook import HooksConfig
@@ -10,55 +7,41 @@ from claude_code_plugins_sdk.models.skill import SkillDefinition
 
 # --- AgentDefinition ---
 
+# Shared required fields: the agent tests only vary the field under test, so
+# validation sees a uniform input shape.
+_AGENT_BASE = {"name": "t", "description": "d"}
+
 
 def test_agent_tools_comma_string():
     """Tools field in YAML is a comma-separated string, not a list."""
-    a = AgentDefinition.model_validate(
-        {
-            "name": "test",
-            "description": "A test agent",
-            "tools": "Read, Write, Bash",
-        }
-    )
+    a = AgentDefinition.model_validate({**_AGENT_BASE, "tools": "Read, Write, Bash"})
     assert a.tools == ["Read", "Write", "Bash"]
 
 
 def test_agent_tools_list_passthrough():
     """Tools can also be a list (future-proofing)."""
-    a = AgentDefinition.model_validate(
-        {
-            "name": "test",
-            "description": "A test agent",
-            "tools": ["Read", "Write"],
-        }
-    )
+    a = AgentDefinition.model_validate({**_AGENT_BASE, "tools": ["Read", "Write"]})
     assert a.tools == ["Read", "Write"]
 
 
 def test_agent_tools_empty():
-    a = AgentDefinition.model_validate({"name": "t", "description": "d", "tools": ""})
+    a = AgentDefinition.model_validate({**_AGENT_BASE, "tools": ""})
     assert a.tools == []
 
 
 def test_agent_tools_default_empty():
-    a = AgentDefinition.model_validate({"name": "t", "description": "d"})
+    a = AgentDefinition.model_validate(_AGENT_BASE)
     assert a.tools == []
 
 
 def test_agent_mcp_wildcard_tool():
     """MCP wildcard tool pattern: mcp__server__*"""
-    a = AgentDefinition.model_validate(
-        {
-            "name": "t",
-            "description": "d",
-            "tools": "Read, mcp__context7__*, Bash",
-        }
-    )
+    a = AgentDefinition.model_validate({**_AGENT_BASE, "tools": "Read, mcp__context7__*, Bash"})
     assert "mcp__context7__*" in a.tools
 
 
 def test_agent_color_optional():
-    a = AgentDefinition.model_validate({"name": "t", "description": "d"})
+    a = AgentDefinition.model_validate(_AGENT_BASE)
     assert a.color is None
 
 
@@ -110,9 +93,8 @@ def test_skill_defaults():
 # --- HooksConfig ---
 
 
-def test_hooks_config():
-    data = json.loads(Path("tests/fixtures/plugin/hooks/hooks.json").read_text())
-    cfg = HooksConfig.model_validate(data)
+def test_hooks_config(hooks_fixture):
+    cfg = HooksConfig.model_validate_json(hooks_fixture)
     assert "PostToolUse" in cfg.hooks
     assert "SessionStart" in cfg.hooks
     post_use = cfg.hooks["PostToolUse"]
@@ -124,9 +106,8 @@ def test_hooks_config():
 # --- MCPServersConfig ---
 
 
-def test_mcp_config():
-    data = json.loads(Path("tests/fixtures/plugin/.mcp.json").read_text())
-    cfg = MCPServersConfig.model_validate(data)
+def test_mcp_config(mcp_fixture):
+    cfg = MCPServersConfig.model_validate_json(mcp_fixture)
     assert "example-db" in cfg.mcp_servers
     assert cfg.mcp_servers["example-db"].command.endswith("db-server")
 
@@ -134,9 +115,8 @@ def test_mcp_config():
 # --- LSPServerConfig ---
 
 
-def test_lsp_config():
-    data = json.loads(Path("tests/fixtures/plugin/.lsp.json").read_text())
-    python_cfg = LSPServerConfig.model_validate(data["python"])
+def test_lsp_config(lsp_fixture):
+    python_cfg = LSPServerConfig.model_validate(lsp_fixture["python"])
     assert python_cfg.command == "pyright"
     assert python_cfg.extension_to_language[".py"] == "python"
     assert python_cfg.restart_on_crash is True
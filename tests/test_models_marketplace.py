@@ -1,6 +1,3 @@
-import json
-from pathlib import Path
-
 import pytest
 from pydantic import ValidationError
 
@@ -14,22 +11,16 @@ from claude_code_plugins_sdk.models.marketplace import (
 )
 
 
-def test_marketplace_full():
+def test_marketplace_full(marketplace_full_fixture):
     """Parse the full marketplace fixture."""
-    data = json.loads(
-        (Path("tests/fixtures/marketplace/.claude-plugin/marketplace.json")).read_text()
-    )
-    m = MarketplaceManifest.model_validate(data)
+    m = MarketplaceManifest.model_validate_json(marketplace_full_fixture)
     assert m.name == "example-marketplace"
     assert m.owner.name == "Test Author"
     assert len(m.plugins) == 5
 
 
-def test_marketplace_minimal():
-    data = json.loads(
-        (Path("tests/fixtures/marketplace/.claude-plugin/minimal-marketplace.json")).read_text()
-    )
-    m = MarketplaceManifest.model_validate(data)
+def test_marketplace_minimal(marketplace_minimal_fixture):
+    m = MarketplaceManifest.model_validate_json(marketplace_minimal_fixture)
     assert m.name == "minimal-marketplace"
     assert m.description is None
     assert len(m.plugins) == 1
@@ -45,42 +36,24 @@ def test_marketplace_missing_owner():
         MarketplaceManifest.model_validate({"name": "test", "plugins": []})
 
 
-def test_source_relative_path():
-    entry = PluginEntry.model_validate({"name": "p", "source": "./plugins/foo"})
-    assert entry.source == "./plugins/foo"
-    assert isinstance(entry.source, str)
-
-
-def test_source_github():
-    entry = PluginEntry.model_validate(
-        {
-            "name": "p",
-            "source": {"source": "github", "repo": "owner/repo", "ref": "v1.0", "sha": "abc123"},
-        }
-    )
-    assert isinstance(entry.source, GitHubSource)
-    assert entry.source.repo == "owner/repo"
-
-
-def test_source_url():
-    entry = PluginEntry.model_validate(
-        {"name": "p", "source": {"source": "url", "url": "https://gitlab.com/x/y.git"}}
-    )
-    assert isinstance(entry.source, URLSource)
-
-
-def test_source_npm():
-    entry = PluginEntry.model_validate(
-        {"name": "p", "source": {"source": "npm", "package": "@example/plugin", "version": "^1.0"}}
-    )
-    assert isinstance(entry.source, NPMSource)
-
-
-def test_source_pip():
-    entry = PluginEntry.model_validate(
-        {"name": "p", "source": {"source": "pip", "package": "my-plugin"}}
-    )
-    assert isinstance(entry.source, PIPSource)
+@pytest.mark.parametrize(
+    ("payload", "expected_type"),
+    [
+        ("./plugins/foo", str),
+        ({"source": "github", "repo": "owner/repo", "ref": "v1.0", "sha": "abc123"}, GitHubSource),
+        ({"source": "url", "url": "https://gitlab.com/x/y.git"}, URLSource),
+        ({"source": "npm", "package": "@example/plugin", "version": "^1.0"}, NPMSource),
+        ({"source": "pip", "package": "my-plugin"}, PIPSource),
+    ],
+    ids=["relative-path", "github", "url", "npm", "pip"],
+)
+def test_source_types(payload, expected_type):
+    entry = PluginEntry.model_validate({"name": "p", "source": payload})
+    assert isinstance(entry.source, expected_type)
+    if expected_type is str:
+        assert entry.source == payload
+    elif expected_type is GitHubSource:
+        assert entry.source.repo == "owner/repo"
 
 
 def test_plugin_entry_defaults():
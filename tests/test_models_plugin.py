@@ -1,15 +1,11 @@
-import json
-from pathlib import Path
-
 import pytest
 from pydantic import ValidationError
 
 from claude_code_plugins_sdk.models.plugin import Author, PluginManifest
 
 
-def test_plugin_manifest_full():
-    data = json.loads((Path("tests/fixtures/plugin/.claude-plugin/plugin.json")).read_text())
-    m = PluginManifest.model_validate(data)
+def test_plugin_manifest_full(plugin_manifest_fixture):
+    m = PluginManifest.model_validate_json(plugin_manifest_fixture)
     assert m.name == "example-plugin"
     assert m.version == "1.2.0"
     assert m.author is not None
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from claude_code_plugins_sdk import (
     ValidationIssue,
     ValidationResult,
@@ -9,7 +11,9 @@ from claude_code_plugins_sdk import (
     validate_plugin_file,
 )
 
-FIXTURE_ROOT = Path("tests/fixtures")
+FIXTURE_ROOT = Path(__file__).resolve().parent / "fixtures"
+PLUGIN_JSON = FIXTURE_ROOT / "plugin" / ".claude-plugin" / "plugin.json"
+MARKETPLACE_JSON = FIXTURE_ROOT / "marketplace" / ".claude-plugin" / "marketplace.json"
 
 
 def test_marketplace_valid_no_warnings():
@@ -25,31 +29,24 @@ def test_marketplace_valid_no_warnings():
     assert result.errors == []
 
 
-def test_marketplace_npm_source_warning():
-    data = {
-        "name": "m",
-        "owner": {"name": "Me"},
-        "plugins": [{"name": "npm-plugin", "source": {"source": "npm", "package": "@x/plugin"}}],
-    }
-    result = validate_marketplace(data)
-    assert result.valid
-    npm_warnings = [i for i in result.warnings if "npm" in i.message]
-    assert len(npm_warnings) == 1
-    assert npm_warnings[0].path == "plugins[0].source"
-    assert "npm source which is not yet fully implemented" in npm_warnings[0].message
-
-
-def test_marketplace_pip_source_warning():
+@pytest.mark.parametrize(
+    ("source_type", "package"),
+    [("npm", "@x/plugin"), ("pip", "x-plugin")],
+)
+def test_marketplace_unimplemented_source_warning(source_type, package):
     data = {
         "name": "m",
         "owner": {"name": "Me"},
-        "plugins": [{"name": "pip-plugin", "source": {"source": "pip", "package": "x-plugin"}}],
+        "plugins": [
+            {"name": f"{source_type}-plugin", "source": {"source": source_type, "package": package}}
+        ],
     }
     result = validate_marketplace(data)
     assert result.valid
-    pip_warnings = [i for i in result.warnings if "pip" in i.message]
-    assert len(pip_warnings) == 1
-    assert "pip source which is not yet fully implemented" in pip_warnings[0].message
+    warnings = [i for i in result.warnings if source_type in i.message]
+    assert len(warnings) == 1
+    assert warnings[0].path == "plugins[0].source"
+    assert f"{source_type} source which is not yet fully implemented" in warnings[0].message
 
 
 def test_marketplace_no_description_warning():
@@ -95,11 +92,16 @@ def test_marketplace_duplicate_plugin_names_error():
     assert dup_errors[0].message == 'Duplicate plugin name "dup" found in marketplace'
 
 
-def test_marketplace_path_traversal_error():
+@pytest.mark.parametrize(
+    "source",
+    ["../other-plugin", "..\\plugins\\x", "plugins/../../etc"],
+    ids=["posix", "windows", "embedded"],
+)
+def test_marketplace_path_traversal_error(source):
     data = {
         "name": "m",
         "owner": {"name": "Me"},
-        "plugins": [{"name": "bad", "source": "../other-plugin"}],
+        "plugins": [{"name": "bad", "source": source}],
     }
     result = validate_marketplace(data)
     assert not result.valid
@@ -121,22 +123,18 @@ def test_marketplace_reserved_name_error():
     assert "claude-code-plugins" in reserved_errors[0].message
 
 
-def test_marketplace_missing_name_error():
-    result = validate_marketplace({"owner": {"name": "Me"}, "plugins": []})
-    assert not result.valid
-    assert any(i.path == "name" and "Required" in i.message for i in result.errors)
-
-
-def test_marketplace_missing_owner_error():
-    result = validate_marketplace({"name": "m", "plugins": []})
-    assert not result.valid
-    assert any(i.path == "owner" and "Required" in i.message for i in result.errors)
-
-
-def test_marketplace_missing_plugins_error():
-    result = validate_marketplace({"name": "m", "owner": {"name": "Me"}})
+@pytest.mark.parametrize(
+    ("payload", "missing_path"),
+    [
+        ({"owner": {"name": "Me"}, "plugins": []}, "name"),
+        ({"name": "m", "plugins": []}, "owner"),
+        ({"name": "m", "owner": {"name": "Me"}}, "plugins"),
+    ],
+)
+def test_marketplace_missing_required_field_error(payload, missing_path):
+    result = validate_marketplace(payload)
     assert not result.valid
-    assert any(i.path == "plugins" and "Required" in i.message for i in result.errors)
+    assert any(i.path == missing_path and "Required" in i.message for i in result.errors)
 
 
 def test_plugin_valid():
@@ -153,15 +151,13 @@ def test_plugin_missing_name_error():
 
 
 def test_validate_plugin_file():
-    path = FIXTURE_ROOT / "plugin" / ".claude-plugin" / "plugin.json"
-    result = validate_plugin_file(path)
+    result = validate_plugin_file(PLUGIN_JSON)
     assert result.valid
     assert result.issues == []
 
 
 def test_validate_marketplace_file():
-    path = FIXTURE_ROOT / "marketplace" / ".claude-plugin" / "marketplace.json"
-    result = validate_marketplace_file(path)
+    result = validate_marketplace_file(MARKETPLACE_JSON)
     assert result.valid
     # Fixture has npm and pip plugins so we get those warnings
     assert len(result.warnings) >= 2